@@ -6,17 +6,26 @@ Tracking is enabled only when:
 
 Events are emitted via Mixpanel with a deterministic distinct_id based on a
 connection fingerprint composed of client IP, client name, and client version.
+When an event loop is running, events are queued and sent by a background
+worker in batches so that tool calls never wait on the Mixpanel network round-trip.
+The Mixpanel client uses a ``BufferedConsumer`` so that several events share one
+HTTP request; the worker flushes it periodically and on shutdown.
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import functools
+import hashlib
 import logging
+import threading
 import uuid
-from typing import Any
+from typing import Any, Protocol
 
 try:
     # Import lazily; tests will mock this
-    from mixpanel import Consumer, Mixpanel
+    from mixpanel import BufferedConsumer, Mixpanel
 except ImportError:  # pragma: no cover
 
     class _MissingMixpanel:  # noqa: D401 - simple placeholder
@@ -25,13 +34,13 @@ except ImportError:  # pragma: no cover
         def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: D401 - simple placeholder
             raise ImportError("Mixpanel library is not installed. Please install 'mixpanel' to use analytics features.")
 
-    Consumer = _MissingMixpanel  # type: ignore[assignment]
+    BufferedConsumer = _MissingMixpanel  # type: ignore[assignment]
     Mixpanel = _MissingMixpanel  # type: ignore[assignment]
 
 from blockscout_mcp_server.client_meta import (
     ClientMeta,
     extract_client_meta_from_ctx,
-    get_header_case_insensitive,
+    get_lowercase_headers,
 )
 from blockscout_mcp_server.config import config
 
@@ -39,94 +48,147 @@ logger = logging.getLogger(__name__)
 
 
 _is_http_mode_enabled: bool = False
-_mp_client: Any | None = None
+
+# Sentinels for the lazily resolved Mixpanel client state. Once resolved, the
+# state holds either the client instance or ``_DISABLED`` so the tracking hot
+# path reduces to a single identity check.
+_UNSET: Any = object()
+_DISABLED: Any = object()
+_mp_state: Any = _UNSET
+# Buffering consumer behind the Mixpanel client; flushed by the delivery worker
+_mp_consumer: Any = None
+
+# Events per Mixpanel HTTP request (the /track endpoint accepts at most 50)
+_MIXPANEL_BUFFER_SIZE = 50
+# Longest time a buffered event may wait for a flush while the server is idle
+_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Background delivery of tracked events. Events beyond the queue capacity are
+# dropped rather than applying back-pressure to tool execution.
+# Each event is (distinct_id, tool_name, properties, meta).
+_TrackedEvent = tuple[str, str, dict[str, Any], dict[str, Any] | None]
+
+_EVENT_QUEUE_MAX_SIZE = 1024
+_EVENT_BATCH_SIZE = 64
+_event_queue: asyncio.Queue[_TrackedEvent] | None = None
+_worker_task: asyncio.Task[None] | None = None
+_worker_loop: asyncio.AbstractEventLoop | None = None
+# BufferedConsumer is not thread-safe; serializes the worker threads that touch it
+_consumer_lock = threading.Lock()
 
 
 def set_http_mode(is_http: bool) -> None:
     """Enable or disable HTTP mode for analytics gating."""
-    global _is_http_mode_enabled
+    global _is_http_mode_enabled, _mp_state
     _is_http_mode_enabled = bool(is_http)
     # Log enablement status once at startup (HTTP path only)
     if _is_http_mode_enabled:
-        token = getattr(config, "mixpanel_token", "")
-        if token:
-            # Best-effort initialize client to validate configuration
-            _ = _get_mixpanel_client()
-            api_host = getattr(config, "mixpanel_api_host", "") or "default"
+        # Resolve the configuration once; the tracking path never reads it again
+        _mp_state = _UNSET
+        client = _get_mixpanel_client()
+        if client is not None:
+            api_host = config.mixpanel_api_host or "default"
             logger.info("Mixpanel analytics enabled (api_host=%s)", api_host)
-        else:
+        elif not config.mixpanel_token:
             logger.debug("Mixpanel analytics not enabled: BLOCKSCOUT_MIXPANEL_TOKEN is not set")
 
 
 def _get_mixpanel_client() -> Any | None:
-    """Return a singleton Mixpanel client if token is configured."""
-    global _mp_client
-    if _mp_client is not None:
-        return _mp_client
-    token = getattr(config, "mixpanel_token", "")
+    """Return a singleton Mixpanel client if token is configured.
+
+    The outcome (client or disabled) is cached, so the configuration is only
+    consulted on the first call.
+    """
+    global _mp_state, _mp_consumer
+    state = _mp_state
+    if state is not _UNSET:
+        return None if state is _DISABLED else state
+    token = config.mixpanel_token
     if not token:
+        _mp_state = _DISABLED
         return None
     try:
-        api_host = getattr(config, "mixpanel_api_host", "")
+        api_host = config.mixpanel_api_host
         if api_host:
-            consumer = Consumer(api_host=api_host)
-            _mp_client = Mixpanel(token, consumer=consumer)
+            consumer = BufferedConsumer(max_size=_MIXPANEL_BUFFER_SIZE, api_host=api_host)
         else:
-            _mp_client = Mixpanel(token)
-        return _mp_client
+            consumer = BufferedConsumer(max_size=_MIXPANEL_BUFFER_SIZE)
+        _mp_state = Mixpanel(token, consumer=consumer)
+        _mp_consumer = consumer
+        return _mp_state
     except Exception as exc:  # pragma: no cover - defensive
         logger.debug("Failed to initialize Mixpanel client: %s", exc)
+        _mp_state = _DISABLED
         return None
 
 
-def _extract_request_ip(ctx: Any) -> str:
+class _RequestContextCarrier(Protocol):
+    """Shape of the contexts analytics reads the HTTP request from.
+
+    Both FastMCP's ``Context`` and the REST ``MockCtx`` expose the Starlette
+    request as ``ctx.request_context.request``.
+    """
+
+    @property
+    def request_context(self) -> Any: ...
+
+
+def _extract_request_ip(ctx: _RequestContextCarrier) -> str:
     """Extract client IP address from context if possible."""
-    ip = ""
     try:
-        request = getattr(getattr(ctx, "request_context", None), "request", None)
-        if request is not None:
-            headers = request.headers or {}
-            # Prefer proxy-forwarded headers
-            xff = get_header_case_insensitive(headers, "x-forwarded-for", "") or ""
-            if xff:
-                # left-most IP per standard
-                ip = xff.split(",")[0].strip()
-            else:
-                x_real_ip = get_header_case_insensitive(headers, "x-real-ip", "") or ""
-                if x_real_ip:
-                    ip = x_real_ip
-                else:
-                    client = getattr(request, "client", None)
-                    if client and getattr(client, "host", None):
-                        ip = client.host
+        request = ctx.request_context.request
+    except (AttributeError, ValueError):
+        # No request attached (MockCtx without a request, or FastMCP's Context
+        # raising ValueError outside of a request)
+        return ""
+    if request is None:
+        return ""
+    try:
+        headers = get_lowercase_headers(request.headers or {})
+        # Prefer proxy-forwarded headers
+        xff = headers.get("x-forwarded-for") or ""
+        if xff:
+            # left-most IP per standard; slice up to the first comma without splitting the whole list
+            comma = xff.find(",")
+            return (xff if comma < 0 else xff[:comma]).strip()
+        x_real_ip = headers.get("x-real-ip") or ""
+        if x_real_ip:
+            return x_real_ip
+        client = request.client
+        if client and client.host:
+            return client.host
     except Exception:  # pragma: no cover - tolerate all shapes
         pass
-    return ip
+    return ""
+
 
+# SHA-1 state primed with the UUIDv5 namespace and the constant URL prefix, so
+# that each distinct_id only hashes the variable part of the fingerprint.
+_DISTINCT_ID_HASH_PREFIX = hashlib.sha1(uuid.NAMESPACE_URL.bytes + b"https://blockscout.com/mcp/")
 
+
+@functools.lru_cache(maxsize=4096)
 def _build_distinct_id(ip: str, client_name: str, client_version: str) -> str:
     # User-Agent is merged into client_name in extract_client_meta_from_ctx when name is unavailable.
     # Therefore composite requires only ip, client_name and client_version for a stable fingerprint.
     composite = "|".join([ip or "", client_name or "", client_version or ""])
-    return str(uuid.uuid5(uuid.NAMESPACE_URL, "https://blockscout.com/mcp/" + composite))
+    # Equivalent to uuid.uuid5(uuid.NAMESPACE_URL, "https://blockscout.com/mcp/" + composite)
+    digest = _DISTINCT_ID_HASH_PREFIX.copy()
+    digest.update(composite.encode("utf-8"))
+    return str(uuid.UUID(bytes=digest.digest()[:16], version=5))
 
 
 def _determine_call_source(ctx: Any) -> str:
-    """Return 'mcp' for MCP calls, 'rest' for REST API, else 'unknown'.
+    """Return the caller-provided ``call_source`` marker, defaulting to 'mcp'.
 
-    Priority:
-    1) Explicit marker set by caller (e.g., REST mock context) via `call_source`.
-    2) Default to 'mcp' when no explicit marker is present (applies to MCP-over-HTTP).
+    REST calls mark their mock context explicitly; contexts without a marker
+    (MCP-over-HTTP) are treated as MCP.
     """
     try:
-        explicit = getattr(ctx, "call_source", None)
-        if isinstance(explicit, str) and explicit:
-            return explicit
-        # No explicit marker: treat as MCP (covers MCP-over-HTTP)
+        explicit = ctx.call_source
+    except AttributeError:
         return "mcp"
-    except Exception:  # pragma: no cover
-        pass
-    return "unknown"
+    return explicit if isinstance(explicit, str) and explicit else "mcp"
 
 
 def track_tool_invocation(
@@ -136,7 +198,7 @@ def track_tool_invocation(
     client_meta: ClientMeta | None = None,
 ) -> None:
     """Track a tool invocation in Mixpanel, if enabled and in HTTP mode."""
-    if not _is_http_mode_enabled:
+    if _mp_state is _DISABLED or not _is_http_mode_enabled:
         return
     mp = _get_mixpanel_client()
     if mp is None:
@@ -170,19 +232,108 @@ def track_tool_invocation(
             "source": _determine_call_source(ctx),
         }
 
-        # TODO: Remove this log after validating Mixpanel analytics end-to-end
-        logger.info(
-            "Mixpanel event prepared: distinct_id=%s tool=%s properties=%s",
-            distinct_id,
-            tool_name,
-            properties,
-        )
+        # Tool arguments are left out on purpose: they can hold entire contract ABIs
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Mixpanel event prepared: distinct_id=%s tool=%s client=%s/%s source=%s",
+                distinct_id,
+                tool_name,
+                client_name,
+                client_version,
+                properties["source"],
+            )
 
         meta = {"ip": ip} if ip else None
-        # Mixpanel Python SDK allows meta for IP geolocation mapping
-        if meta is not None:
-            mp.track(distinct_id, tool_name, properties, meta=meta)  # type: ignore[call-arg]
-        else:
-            mp.track(distinct_id, tool_name, properties)
+        _enqueue_event(mp, (distinct_id, tool_name, properties, meta))
     except Exception as exc:  # pragma: no cover - do not break tool flow
         logger.debug("Mixpanel tracking failed for %s: %s", tool_name, exc)
+
+
+def _emit_events(mp: Any, events: list[_TrackedEvent]) -> None:
+    """Send tracked events to Mixpanel (blocking network I/O)."""
+    with _consumer_lock:
+        for distinct_id, tool_name, properties, meta in events:
+            try:
+                # Mixpanel Python SDK allows meta for IP geolocation mapping
+                if meta is not None:
+                    mp.track(distinct_id, tool_name, properties, meta=meta)  # type: ignore[call-arg]
+                else:
+                    mp.track(distinct_id, tool_name, properties)
+            except Exception as exc:  # pragma: no cover - do not break the worker
+                logger.debug("Mixpanel tracking failed for %s: %s", tool_name, exc)
+
+
+def _enqueue_event(mp: Any, event: _TrackedEvent) -> None:
+    """Hand an event to the background worker, or emit it inline without a running loop."""
+    global _event_queue, _worker_task, _worker_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _emit_events(mp, [event])
+        _flush_consumer()
+        return
+    if _event_queue is None or _worker_loop is not loop or _worker_task is None or _worker_task.done():
+        _event_queue = asyncio.Queue(maxsize=_EVENT_QUEUE_MAX_SIZE)
+        _worker_loop = loop
+        _worker_task = loop.create_task(_analytics_worker(_event_queue, mp))
+    try:
+        _event_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        logger.debug("Mixpanel event queue is full; dropping event for %s", event[1])
+
+
+def _flush_consumer() -> None:
+    """Send any events buffered by the Mixpanel consumer (blocking network I/O)."""
+    consumer = _mp_consumer
+    if consumer is None:
+        return
+    try:
+        with _consumer_lock:
+            consumer.flush()
+    except Exception as exc:  # pragma: no cover - do not break the worker
+        logger.debug("Mixpanel flush failed: %s", exc)
+
+
+async def _analytics_worker(queue: asyncio.Queue[_TrackedEvent], mp: Any) -> None:
+    """Drain the event queue in batches and send them off the event loop thread.
+
+    Full buffers are sent by the consumer itself; whatever remains is flushed
+    once no new event has arrived for ``_FLUSH_INTERVAL_SECONDS``.
+    """
+    needs_flush = False
+    while True:
+        if needs_flush:
+            try:
+                first = await asyncio.wait_for(queue.get(), timeout=_FLUSH_INTERVAL_SECONDS)
+            except TimeoutError:
+                await asyncio.to_thread(_flush_consumer)
+                needs_flush = False
+                continue
+        else:
+            first = await queue.get()
+        batch = [first]
+        while len(batch) < _EVENT_BATCH_SIZE:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        try:
+            await asyncio.to_thread(_emit_events, mp, batch)
+            needs_flush = True
+        finally:
+            for _ in batch:
+                queue.task_done()
+
+
+async def flush_pending_events() -> None:
+    """Hand all queued events to Mixpanel, stop the worker and flush the consumer buffer."""
+    if _event_queue is not None and _worker_loop is asyncio.get_running_loop():
+        await _event_queue.join()
+        worker = _worker_task
+        if worker is not None and not worker.done():
+            # Stop the idle worker so it is not destroyed pending when the loop closes
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+    # Waits on the consumer lock if a cancelled idle flush is still running in its thread
+    await asyncio.to_thread(_flush_consumer)
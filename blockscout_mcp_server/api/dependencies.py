@@ -8,9 +8,19 @@ if TYPE_CHECKING:  # pragma: no cover - typing-only import
     from starlette.requests import Request
 
 
+async def _noop_info(message: str) -> None:
+    """Simulate the ``info`` method of an MCP ``Context``."""
+
+
+async def _noop_report_progress(*args, **kwargs) -> None:
+    """Simulate the ``report_progress`` method of an MCP ``Context``."""
+
+
 class _RequestContextWrapper:
     """Lightweight wrapper to mimic MCP's request_context shape for analytics."""
 
+    __slots__ = ("request",)
+
     def __init__(self, request: Request) -> None:
         self.request: Request = request
 
@@ -25,19 +35,17 @@ class MockCtx:
     analytics can extract connection fingerprint data.
     """
 
+    __slots__ = ("request_context", "call_source")
+
+    # Plain functions exposed as static methods: no bound method per call
+    info = staticmethod(_noop_info)
+    report_progress = staticmethod(_noop_report_progress)
+
     def __init__(self, request: Request | None = None) -> None:
         self.request_context = _RequestContextWrapper(request) if request is not None else None
         # Mark source explicitly so analytics can distinguish REST from MCP without path coupling
         self.call_source = "rest"
 
-    async def info(self, message: str) -> None:
-        """Simulate the ``info`` method of an MCP ``Context``."""
-        pass
-
-    async def report_progress(self, *args, **kwargs) -> None:
-        """Simulate the ``report_progress`` method of an MCP ``Context``."""
-        pass
-
 
 def get_mock_context(request: Request | None = None) -> MockCtx:
     """Dependency provider to get a mock context for stateless REST calls."""
@@ -1,19 +1,32 @@
 """Shared utilities for REST API route handlers."""
 
-from collections.abc import Awaitable, Callable
-from functools import wraps
+import json
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import httpx
+from pydantic import BaseModel
+from starlette.exceptions import HTTPException
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from blockscout_mcp_server.models import ToolResponse
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+_TRUE_STRINGS = frozenset({"true", "1", "t", "yes"})
+# Common spellings of the truthy strings, matched without lowercasing the input
+_TRUE_STRINGS_FAST = _TRUE_STRINGS | frozenset({"True", "TRUE", "T", "Yes", "YES"})
+
 
 def str_to_bool(val: str) -> bool:
     """Convert a string to a boolean value."""
-    return val.lower() in ("true", "1", "t", "yes")
+    return val in _TRUE_STRINGS_FAST or val.lower() in _TRUE_STRINGS
 
 
 # A map of parameter names to their type conversion functions.
@@ -24,58 +37,125 @@ PARAM_TYPES: dict[str, Callable[[str], Any]] = {
 }
 
 
-def extract_and_validate_params(request: Request, required: list[str], optional: list[str]) -> dict[str, Any]:
-    """Extract and validate query parameters from a request.
+ParamExtractor = Callable[[Request], dict[str, Any]]
+
+
+def compile_param_extractor(required: Sequence[str], optional: Sequence[str]) -> ParamExtractor:
+    """Build a query parameter extractor specialized for a single route.
+
+    The parameter layout of every REST endpoint is fixed at startup, so the
+    converter lookup in ``PARAM_TYPES`` is resolved once here and captured in a
+    frozen spec instead of being repeated on every request.
 
     Args:
-        request: The Starlette request object.
-        required: A list of required parameter names.
-        optional: A list of optional parameter names.
+        required: Names of the parameters that must be present.
+        optional: Names of the parameters that may be omitted.
 
     Returns:
-        A dictionary of validated parameters.
+        A function that takes a Starlette request and returns a dictionary of
+        validated parameters. It raises ``ValueError`` if a required parameter
+        is missing.
+    """
+    spec: tuple[tuple[str, Callable[[str], Any], bool], ...] = tuple(
+        (name, PARAM_TYPES.get(name, str), True) for name in required
+    ) + tuple((name, PARAM_TYPES.get(name, str), False) for name in optional)
+
+    def extract(request: Request) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        # Snapshot into a plain dict (last value wins, as with ``QueryParams.get``)
+        # so each lookup below is a C-level dict access rather than a Mapping.get call
+        query_params = dict(request.query_params.items())
+        for name, convert, is_required in spec:
+            value = query_params.get(name)
+            if value is None:
+                if is_required:
+                    raise ValueError(f"Missing required query parameter: '{name}'")
+                continue
+            params[name] = convert(value)
+        return params
+
+    return extract
+
+
+def loads_json(data: str) -> Any:
+    """Parse JSON with orjson when available, otherwise with the stdlib.
+
+    orjson converts integers beyond 64 bits to floats, so this must only be
+    used for payloads that cannot carry such values (e.g. ABI definitions).
+    Decoding errors are raised as ``json.JSONDecodeError`` in both cases.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class ORJSONResponse(JSONResponse):
+    """``JSONResponse`` rendered with orjson when it is installed.
 
-    Raises:
-        ValueError: If a required parameter is missing.
+    Falls back to the stdlib encoder when orjson is missing or rejects the
+    content, e.g. integers beyond 64 bits returned by contract reads.
     """
-    params: dict[str, Any] = {}
-    query_params = request.query_params
 
-    for name in required:
-        value = query_params.get(name)
-        if value is None:
-            raise ValueError(f"Missing required query parameter: '{name}'")
-        params[name] = PARAM_TYPES.get(name, str)(value)
+    def render(self, content: Any) -> bytes:
+        if orjson is not None:
+            try:
+                return orjson.dumps(content)
+            except TypeError:
+                pass
+        return super().render(content)
 
-    for name in optional:
-        value = query_params.get(name)
-        if value is not None:
-            params[name] = PARAM_TYPES.get(name, str)(value)
 
-    return params
+def pydantic_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Return a JSON response serialized directly by pydantic.
 
+    ``model_dump_json`` encodes in pydantic-core without building an
+    intermediate ``dict`` that would then be re-encoded by ``JSONResponse``.
+    """
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
 
-def handle_rest_errors(
-    func: Callable[[Request], Awaitable[Response]],
-) -> Callable[[Request], Awaitable[Response]]:
-    """Decorator to handle common REST API errors and return JSON responses."""
 
-    @wraps(func)
-    async def wrapper(request: Request) -> Response:
-        try:
-            return await func(request)
-        except ValueError as e:
-            return JSONResponse({"error": str(e)}, status_code=400)
-        except httpx.HTTPStatusError as e:
-            return JSONResponse({"error": str(e)}, status_code=e.response.status_code)
-        except (httpx.TimeoutException, TimeoutError) as e:
-            return JSONResponse({"error": str(e)}, status_code=504)
-        except RuntimeError as e:
-            return JSONResponse({"error": str(e)}, status_code=500)
-        except Exception as e:  # pragma: no cover - generic catch-all
-            return JSONResponse({"error": str(e)}, status_code=500)
+def rest_error_response(exc: Exception) -> Response:
+    """Translate an exception raised by a REST handler into a JSON error response."""
+    if isinstance(exc, ValueError):
+        status_code = 400
+    elif isinstance(exc, httpx.HTTPStatusError):
+        status_code = exc.response.status_code
+    elif isinstance(exc, (httpx.TimeoutException, TimeoutError)):
+        status_code = 504
+    else:
+        status_code = 500
+    return JSONResponse({"error": str(exc)}, status_code=status_code)
+
+
+class RestErrorMiddleware:
+    """ASGI middleware that converts REST handler errors into JSON responses.
+
+    It wraps the whole ``/v1`` router once, so individual handlers need no
+    per-function error wrapper. Starlette's ``HTTPException`` (e.g. a 404 from
+    routing) is left to the framework, and errors raised after the response has
+    started are re-raised because a second response cannot be sent.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response_started = False
 
-    return wrapper
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            if response_started:
+                raise
+            await rest_error_response(exc)(scope, receive, send)
 
 
 def create_deprecation_response() -> Response:
@@ -85,4 +165,4 @@ def create_deprecation_response() -> Response:
         "Please use the recommended workflow: first, call `get_transactions_by_address` (which supports time filtering), and then use `get_transaction_logs` for each relevant transaction hash.",  # noqa: E501
     ]
     tool_response = ToolResponse(data={"status": "deprecated"}, notes=deprecation_notes)
-    return JSONResponse(tool_response.model_dump(), status_code=410)
+    return pydantic_response(tool_response, status_code=410)
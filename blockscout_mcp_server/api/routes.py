@@ -1,20 +1,28 @@
 """Module for registering all REST API routes with the FastMCP server."""
 
+import functools
+import hashlib
 import json
 import pathlib
 from collections.abc import Callable
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+from starlette.responses import JSONResponse, PlainTextResponse, Response
+from starlette.routing import Route, Router
 
 from blockscout_mcp_server.api.dependencies import get_mock_context
 from blockscout_mcp_server.api.helpers import (
+    ORJSONResponse,
+    RestErrorMiddleware,
+    compile_param_extractor,
     create_deprecation_response,
-    extract_and_validate_params,
-    handle_rest_errors,
+    loads_json,
+    pydantic_response,
 )
+from blockscout_mcp_server.constants import REST_GZIP_COMPRESS_LEVEL, REST_GZIP_MINIMUM_SIZE
 from blockscout_mcp_server.tools.address_tools import (
     get_address_info,
     get_tokens_by_address,
@@ -62,23 +70,48 @@ async def health_check(_: Request) -> Response:
     return JSONResponse({"status": "ok"})
 
 
-async def serve_llms_txt(_: Request) -> Response:
+# Browsers and crawlers may revalidate static pages for this long without a request
+STATIC_CACHE_CONTROL = "public, max-age=300"
+
+
+@functools.lru_cache(maxsize=8)
+def _static_payload(content: str) -> tuple[bytes, str]:
+    """Return the encoded body and its strong ETag for a static page."""
+    body = content.encode("utf-8")
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+def _static_response(request: Request, content: str, media_type: str) -> Response:
+    """Serve preloaded static content, answering matching revalidations with 304."""
+    body, etag = _static_payload(content)
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type=media_type, headers=headers)
+
+
+# Encode and hash the preloaded pages once up front instead of on first request
+for _content in (INDEX_HTML_CONTENT, LLMS_TXT_CONTENT):
+    if _content is not None:
+        _static_payload(_content)
+
+
+async def serve_llms_txt(request: Request) -> Response:
     """Serve the llms.txt file."""
     if LLMS_TXT_CONTENT is None:
         message = "llms.txt content is not available."
         return PlainTextResponse(message, status_code=500)
-    return PlainTextResponse(LLMS_TXT_CONTENT)
+    return _static_response(request, LLMS_TXT_CONTENT, "text/plain")
 
 
-async def main_page(_: Request) -> Response:
+async def main_page(request: Request) -> Response:
     """Serve the main landing page."""
     if INDEX_HTML_CONTENT is None:
         message = "Landing page content is not available."
         return PlainTextResponse(message, status_code=500)
-    return HTMLResponse(INDEX_HTML_CONTENT)
+    return _static_response(request, INDEX_HTML_CONTENT, "text/html")
 
 
-@handle_rest_errors
 async def get_instructions_rest(request: Request) -> Response:
     """REST wrapper for the __unlock_blockchain_analysis__ tool."""
     # NOTE: This endpoint exists solely for backward compatibility. It duplicates
@@ -86,107 +119,123 @@ async def get_instructions_rest(request: Request) -> Response:
     # old route will be removed soon and another wrapper would add needless
     # indirection.
     tool_response = await __unlock_blockchain_analysis__(ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
 
 
-@handle_rest_errors
 async def unlock_blockchain_analysis_rest(request: Request) -> Response:
     """REST wrapper for the __unlock_blockchain_analysis__ tool."""
     tool_response = await __unlock_blockchain_analysis__(ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+# Query parameter extractors are compiled once per route at import time so that
+# request handling does not repeat the parameter spec resolution.
+_GET_BLOCK_INFO_PARAMS = compile_param_extractor(
+    required=("chain_id", "number_or_hash"),
+    optional=("include_transactions",),
+)
 
 
-@handle_rest_errors
 async def get_block_info_rest(request: Request) -> Response:
     """REST wrapper for the get_block_info tool."""
-    params = extract_and_validate_params(
-        request,
-        required=["chain_id", "number_or_hash"],
-        optional=["include_transactions"],
-    )
+    params = _GET_BLOCK_INFO_PARAMS(request)
     tool_response = await get_block_info(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_LATEST_BLOCK_PARAMS = compile_param_extractor(required=("chain_id",), optional=())
 
 
-@handle_rest_errors
 async def get_latest_block_rest(request: Request) -> Response:
     """REST wrapper for the get_latest_block tool."""
-    params = extract_and_validate_params(request, required=["chain_id"], optional=[])
+    params = _GET_LATEST_BLOCK_PARAMS(request)
     tool_response = await get_latest_block(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_ADDRESS_BY_ENS_NAME_PARAMS = compile_param_extractor(required=("name",), optional=())
 
 
-@handle_rest_errors
 async def get_address_by_ens_name_rest(request: Request) -> Response:
     """REST wrapper for the get_address_by_ens_name tool."""
-    params = extract_and_validate_params(request, required=["name"], optional=[])
+    params = _GET_ADDRESS_BY_ENS_NAME_PARAMS(request)
     tool_response = await get_address_by_ens_name(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_TRANSACTIONS_BY_ADDRESS_PARAMS = compile_param_extractor(
+    required=("chain_id", "address"),
+    optional=("age_from", "age_to", "methods", "cursor"),
+)
 
 
-@handle_rest_errors
 async def get_transactions_by_address_rest(request: Request) -> Response:
     """REST wrapper for the get_transactions_by_address tool."""
-    params = extract_and_validate_params(
-        request,
-        required=["chain_id", "address"],
-        optional=["age_from", "age_to", "methods", "cursor"],
-    )
+    params = _GET_TRANSACTIONS_BY_ADDRESS_PARAMS(request)
     tool_response = await get_transactions_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_TOKEN_TRANSFERS_BY_ADDRESS_PARAMS = compile_param_extractor(
+    required=("chain_id", "address"),
+    optional=("age_from", "age_to", "token", "cursor"),
+)
 
 
-@handle_rest_errors
 async def get_token_transfers_by_address_rest(request: Request) -> Response:
     """REST wrapper for the get_token_transfers_by_address tool."""
-    params = extract_and_validate_params(
-        request,
-        required=["chain_id", "address"],
-        optional=["age_from", "age_to", "token", "cursor"],
-    )
+    params = _GET_TOKEN_TRANSFERS_BY_ADDRESS_PARAMS(request)
     tool_response = await get_token_transfers_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_LOOKUP_TOKEN_BY_SYMBOL_PARAMS = compile_param_extractor(required=("chain_id", "symbol"), optional=())
 
 
-@handle_rest_errors
 async def lookup_token_by_symbol_rest(request: Request) -> Response:
     """REST wrapper for the lookup_token_by_symbol tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "symbol"], optional=[])
+    params = _LOOKUP_TOKEN_BY_SYMBOL_PARAMS(request)
     tool_response = await lookup_token_by_symbol(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_CONTRACT_ABI_PARAMS = compile_param_extractor(required=("chain_id", "address"), optional=())
 
 
-@handle_rest_errors
 async def get_contract_abi_rest(request: Request) -> Response:
     """REST wrapper for the get_contract_abi tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "address"], optional=[])
+    params = _GET_CONTRACT_ABI_PARAMS(request)
     tool_response = await get_contract_abi(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_INSPECT_CONTRACT_CODE_PARAMS = compile_param_extractor(required=("chain_id", "address"), optional=("file_name",))
 
 
-@handle_rest_errors
 async def inspect_contract_code_rest(request: Request) -> Response:
     """REST wrapper for the inspect_contract_code tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["file_name"])
+    params = _INSPECT_CONTRACT_CODE_PARAMS(request)
     tool_response = await inspect_contract_code(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_READ_CONTRACT_PARAMS = compile_param_extractor(
+    required=("chain_id", "address", "abi", "function_name"),
+    optional=("args", "block"),
+)
 
 
-@handle_rest_errors
 async def read_contract_rest(request: Request) -> Response:
     """REST wrapper for the read_contract tool."""
-    params = extract_and_validate_params(
-        request,
-        required=["chain_id", "address", "abi", "function_name"],
-        optional=["args", "block"],
-    )
+    params = _READ_CONTRACT_PARAMS(request)
     try:
-        params["abi"] = json.loads(params["abi"])
+        params["abi"] = loads_json(params["abi"])
     except json.JSONDecodeError as e:
         raise ValueError("Invalid JSON for 'abi'") from e
     if not isinstance(params["abi"], dict):
         raise ValueError("'abi' must be a JSON object")
     if "args" in params:
+        # Stdlib parser keeps uint256 arguments as exact integers
         try:
             params["args"] = json.loads(params["args"])
         except json.JSONDecodeError as e:
@@ -194,77 +243,113 @@ async def read_contract_rest(request: Request) -> Response:
     if "block" in params and params["block"].isdigit():
         params["block"] = int(params["block"])
     tool_response = await read_contract(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_ADDRESS_INFO_PARAMS = compile_param_extractor(required=("chain_id", "address"), optional=())
 
 
-@handle_rest_errors
 async def get_address_info_rest(request: Request) -> Response:
     """REST wrapper for the get_address_info tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "address"], optional=[])
+    params = _GET_ADDRESS_INFO_PARAMS(request)
     tool_response = await get_address_info(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_TOKENS_BY_ADDRESS_PARAMS = compile_param_extractor(required=("chain_id", "address"), optional=("cursor",))
 
 
-@handle_rest_errors
 async def get_tokens_by_address_rest(request: Request) -> Response:
     """REST wrapper for the get_tokens_by_address tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["cursor"])
+    params = _GET_TOKENS_BY_ADDRESS_PARAMS(request)
     tool_response = await get_tokens_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_TRANSACTION_SUMMARY_PARAMS = compile_param_extractor(required=("chain_id", "transaction_hash"), optional=())
 
 
-@handle_rest_errors
 async def transaction_summary_rest(request: Request) -> Response:
     """REST wrapper for the transaction_summary tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "transaction_hash"], optional=[])
+    params = _TRANSACTION_SUMMARY_PARAMS(request)
     tool_response = await transaction_summary(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_NFT_TOKENS_BY_ADDRESS_PARAMS = compile_param_extractor(required=("chain_id", "address"), optional=("cursor",))
 
 
-@handle_rest_errors
 async def nft_tokens_by_address_rest(request: Request) -> Response:
     """REST wrapper for the nft_tokens_by_address tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "address"], optional=["cursor"])
+    params = _NFT_TOKENS_BY_ADDRESS_PARAMS(request)
     tool_response = await nft_tokens_by_address(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_TRANSACTION_INFO_PARAMS = compile_param_extractor(
+    required=("chain_id", "transaction_hash"),
+    optional=("include_raw_input",),
+)
 
 
-@handle_rest_errors
 async def get_transaction_info_rest(request: Request) -> Response:
     """REST wrapper for the get_transaction_info tool."""
-    params = extract_and_validate_params(
-        request,
-        required=["chain_id", "transaction_hash"],
-        optional=["include_raw_input"],
-    )
+    params = _GET_TRANSACTION_INFO_PARAMS(request)
     tool_response = await get_transaction_info(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+_GET_TRANSACTION_LOGS_PARAMS = compile_param_extractor(
+    required=("chain_id", "transaction_hash"),
+    optional=("cursor",),
+)
 
 
-@handle_rest_errors
 async def get_transaction_logs_rest(request: Request) -> Response:
     """REST wrapper for the get_transaction_logs tool."""
-    params = extract_and_validate_params(request, required=["chain_id", "transaction_hash"], optional=["cursor"])
+    params = _GET_TRANSACTION_LOGS_PARAMS(request)
     tool_response = await get_transaction_logs(**params, ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
 
 
-@handle_rest_errors
 async def get_address_logs_rest(request: Request) -> Response:
     """REST wrapper for the get_address_logs tool. This endpoint is deprecated."""
     return create_deprecation_response()
 
 
-@handle_rest_errors
 async def get_chains_list_rest(request: Request) -> Response:
     """REST wrapper for the get_chains_list tool."""
     tool_response = await get_chains_list(ctx=get_mock_context(request))
-    return JSONResponse(tool_response.model_dump())
+    return pydantic_response(tool_response)
+
+
+# Tool wrappers served under /v1/, as (path, handler) pairs
+_V1_TOOL_ROUTES: tuple[tuple[str, Callable[..., Any]], ...] = (
+    ("/get_instructions", get_instructions_rest),
+    ("/unlock_blockchain_analysis", unlock_blockchain_analysis_rest),
+    ("/get_block_info", get_block_info_rest),
+    ("/get_latest_block", get_latest_block_rest),
+    ("/get_address_by_ens_name", get_address_by_ens_name_rest),
+    ("/get_transactions_by_address", get_transactions_by_address_rest),
+    ("/get_token_transfers_by_address", get_token_transfers_by_address_rest),
+    ("/lookup_token_by_symbol", lookup_token_by_symbol_rest),
+    ("/get_contract_abi", get_contract_abi_rest),
+    ("/inspect_contract_code", inspect_contract_code_rest),
+    ("/read_contract", read_contract_rest),
+    ("/get_address_info", get_address_info_rest),
+    ("/get_tokens_by_address", get_tokens_by_address_rest),
+    ("/transaction_summary", transaction_summary_rest),
+    ("/nft_tokens_by_address", nft_tokens_by_address_rest),
+    ("/get_transaction_info", get_transaction_info_rest),
+    ("/get_transaction_logs", get_transaction_logs_rest),
+    ("/get_address_logs", get_address_logs_rest),
+    ("/get_chains_list", get_chains_list_rest),
+)
 
 
-def _add_v1_tool_route(mcp: FastMCP, path: str, handler: Callable[..., Any]) -> None:
-    """Register a tool route under the /v1/ prefix."""
-    mcp.custom_route(f"/v1{path}", methods=["GET"])(handler)
+def _add_v1_tool_route(routes: list[Route], path: str, handler: Callable[..., Any]) -> None:
+    """Add a tool route under the /v1/ prefix to the v1 router."""
+    routes.append(Route(f"/v1{path}", handler, methods=["GET"]))
 
 
 def register_api_routes(mcp: FastMCP) -> None:
@@ -278,7 +363,7 @@ def register_api_routes(mcp: FastMCP) -> None:
         # This reduces coupling to the underlying ASGI app and makes unit tests
         # simpler because no custom state injection is required.
         tools_list = await mcp.list_tools()
-        return JSONResponse([tool.model_dump() for tool in tools_list])
+        return ORJSONResponse([tool.model_dump() for tool in tools_list])
 
     # These routes are not part of the OpenAPI schema for tools.
     mcp.custom_route("/health", methods=["GET"], include_in_schema=False)(health_check)
@@ -286,23 +371,19 @@ def register_api_routes(mcp: FastMCP) -> None:
     mcp.custom_route("/", methods=["GET"], include_in_schema=False)(main_page)
 
     # Version 1 of the REST API
-    _add_v1_tool_route(mcp, "/tools", list_tools_rest)
-    _add_v1_tool_route(mcp, "/get_instructions", get_instructions_rest)
-    _add_v1_tool_route(mcp, "/unlock_blockchain_analysis", unlock_blockchain_analysis_rest)
-    _add_v1_tool_route(mcp, "/get_block_info", get_block_info_rest)
-    _add_v1_tool_route(mcp, "/get_latest_block", get_latest_block_rest)
-    _add_v1_tool_route(mcp, "/get_address_by_ens_name", get_address_by_ens_name_rest)
-    _add_v1_tool_route(mcp, "/get_transactions_by_address", get_transactions_by_address_rest)
-    _add_v1_tool_route(mcp, "/get_token_transfers_by_address", get_token_transfers_by_address_rest)
-    _add_v1_tool_route(mcp, "/lookup_token_by_symbol", lookup_token_by_symbol_rest)
-    _add_v1_tool_route(mcp, "/get_contract_abi", get_contract_abi_rest)
-    _add_v1_tool_route(mcp, "/inspect_contract_code", inspect_contract_code_rest)
-    _add_v1_tool_route(mcp, "/read_contract", read_contract_rest)
-    _add_v1_tool_route(mcp, "/get_address_info", get_address_info_rest)
-    _add_v1_tool_route(mcp, "/get_tokens_by_address", get_tokens_by_address_rest)
-    _add_v1_tool_route(mcp, "/transaction_summary", transaction_summary_rest)
-    _add_v1_tool_route(mcp, "/nft_tokens_by_address", nft_tokens_by_address_rest)
-    _add_v1_tool_route(mcp, "/get_transaction_info", get_transaction_info_rest)
-    _add_v1_tool_route(mcp, "/get_transaction_logs", get_transaction_logs_rest)
-    _add_v1_tool_route(mcp, "/get_address_logs", get_address_logs_rest)
-    _add_v1_tool_route(mcp, "/get_chains_list", get_chains_list_rest)
+    v1_routes: list[Route] = []
+    _add_v1_tool_route(v1_routes, "/tools", list_tools_rest)
+    for path, handler in _V1_TOOL_ROUTES:
+        _add_v1_tool_route(v1_routes, path, handler)
+
+    # All v1 routes sit behind a single catch-all route so that error translation
+    # is applied once by ``RestErrorMiddleware`` rather than wrapped per handler.
+    # Tool responses (ABIs, transaction lists, NFT metadata) are large, highly
+    # compressible JSON, so they are gzipped for clients that accept it. The MCP
+    # endpoint is left untouched so streamed responses are not buffered.
+    v1_app = GZipMiddleware(
+        RestErrorMiddleware(Router(routes=v1_routes)),
+        minimum_size=REST_GZIP_MINIMUM_SIZE,
+        compresslevel=REST_GZIP_COMPRESS_LEVEL,
+    )
+    mcp.custom_route("/v1/{path:path}", methods=["GET"])(v1_app)
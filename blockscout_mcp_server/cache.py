@@ -1,7 +1,10 @@
-"""Simple in-memory cache for chain metadata."""
+"""Simple in-memory caches for chain metadata and upstream responses."""
 
+import asyncio
+import logging
 import time
-from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
 
 import anyio
 from pydantic import BaseModel, Field
@@ -9,67 +12,115 @@ from pydantic import BaseModel, Field
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.models import ChainInfo
 
+logger = logging.getLogger(__name__)
+
 
 class ChainCache:
+    """In-process TTL cache of Blockscout URLs keyed by chain ID.
+
+    Every mutation is a single dict operation with no ``await`` in between, so
+    coroutines cannot interleave inside one and no per-chain locks are needed.
+    Concurrent misses are coalesced by ``get_or_fetch`` instead.
+    """
+
     def __init__(self) -> None:
         self._cache: dict[str, tuple[str | None, float]] = {}
-        self._locks_lock = anyio.Lock()
-        self._locks: dict[str, anyio.Lock] = {}
-
-    async def _get_or_create_lock(self, chain_id: str) -> anyio.Lock:
-        """Get or create a lock for a specific chain."""
-        if lock := self._locks.get(chain_id):
-            return lock
-        async with self._locks_lock:
-            if lock := self._locks.get(chain_id):
-                return lock
-            new_lock = anyio.Lock()
-            self._locks[chain_id] = new_lock
-            return new_lock
-
-    @property
-    def _lock_keys(self) -> set[str]:
-        """Return a snapshot of chain IDs with initialized locks."""
-        return set(self._locks.keys())
+        self._inflight: dict[str, asyncio.Future[str | None]] = {}
+        # Strong references keep background refreshes alive until they finish
+        self._refresh_tasks: set[asyncio.Task[str | None]] = set()
 
     def get(self, chain_id: str) -> tuple[str | None, float] | None:
-        """Retrieve an entry without validating expiry (no locking).
+        """Retrieve a fresh entry (no locking); expired entries are evicted on read.
 
         Returns ``(url_or_none, expiry_monotonic)`` or ``None``.
         """
-        return self._cache.get(chain_id)
+        entry = self._cache.get(chain_id)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1]:
+            self._cache.pop(chain_id, None)
+            return None
+        return entry
+
+    async def get_or_fetch(self, chain_id: str, fetcher: Callable[[], Awaitable[str | None]]) -> str | None:
+        """Return the cached URL, coalescing concurrent misses into a single fetch.
+
+        The first caller to miss runs ``fetcher`` and caches its result; callers
+        arriving while that fetch is in flight await the same outcome, including
+        any exception it raises. Hits never contend.
+
+        An expired URL is served stale while a background fetch refreshes it, so
+        only the first lookup of a chain waits on Chainscout. Expired failures
+        are not served stale and are fetched again in the foreground.
+        """
+        entry = self._cache.get(chain_id)
+        if entry is not None:
+            blockscout_url, expiry = entry
+            if time.monotonic() < expiry:
+                return blockscout_url
+            if blockscout_url is not None:
+                if chain_id not in self._inflight:
+                    task = asyncio.create_task(self._fetch(chain_id, fetcher, self._start_fetch(chain_id)))
+                    self._refresh_tasks.add(task)
+                    task.add_done_callback(self._finish_refresh)
+                return blockscout_url
+        if (inflight := self._inflight.get(chain_id)) is not None:
+            # Shield so a cancelled follower does not cancel the shared fetch
+            return await asyncio.shield(inflight)
+        return await self._fetch(chain_id, fetcher, self._start_fetch(chain_id))
+
+    def _start_fetch(self, chain_id: str) -> asyncio.Future[str | None]:
+        """Register an in-flight fetch before it starts so later callers join it."""
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._inflight[chain_id] = future
+        return future
+
+    async def _fetch(
+        self,
+        chain_id: str,
+        fetcher: Callable[[], Awaitable[str | None]],
+        future: asyncio.Future[str | None],
+    ) -> str | None:
+        """Run ``fetcher``, cache its result and publish the outcome to ``future``."""
+        try:
+            blockscout_url = await fetcher()
+            await self.set(chain_id, blockscout_url)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark as retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(blockscout_url)
+            return blockscout_url
+        finally:
+            self._inflight.pop(chain_id, None)
+
+    def _finish_refresh(self, task: asyncio.Task[str | None]) -> None:
+        """Drop a finished background refresh; a failure keeps serving the stale URL."""
+        self._refresh_tasks.discard(task)
+        if not task.cancelled() and (exc := task.exception()) is not None:
+            logger.debug("Background refresh of a cached Blockscout URL failed: %s", exc)
 
     async def set(self, chain_id: str, blockscout_url: str | None) -> None:
         """Cache the URL (or lack thereof) for a single chain."""
-        expiry = time.monotonic() + config.chain_cache_ttl_seconds
-        chain_lock = await self._get_or_create_lock(chain_id)
-        async with chain_lock:
-            self._cache[chain_id] = (blockscout_url, expiry)
+        self._cache[chain_id] = (blockscout_url, time.monotonic() + config.chain_cache_ttl_seconds)
 
     async def set_failure(self, chain_id: str) -> None:
         """Cache a failure to find a chain."""
         await self.set(chain_id, None)
 
     async def bulk_set(self, chain_urls: dict[str, str | None]) -> None:
-        """Cache URLs from a bulk /api/chains response concurrently."""
+        """Cache URLs from a bulk /api/chains response with a shared expiry."""
         expiry = time.monotonic() + config.chain_cache_ttl_seconds
-
-        async def _set_with_expiry(chain_id: str, url: str | None) -> None:
-            chain_lock = await self._get_or_create_lock(chain_id)
-            async with chain_lock:
-                self._cache[chain_id] = (url, expiry)
-
-        async with anyio.create_task_group() as tg:
-            for chain_id, url in chain_urls.items():
-                tg.start_soon(_set_with_expiry, chain_id, url)
+        self._cache.update({chain_id: (url, expiry) for chain_id, url in chain_urls.items()})
 
     async def invalidate(self, chain_id: str) -> None:
         """Remove an entry from the cache if present."""
-        if chain_id not in self._cache:
-            return
-        chain_lock = await self._get_or_create_lock(chain_id)
-        async with chain_lock:
-            self._cache.pop(chain_id, None)
+        self._cache.pop(chain_id, None)
 
 
 class ChainsListCache:
@@ -104,35 +155,136 @@ class CachedContract(BaseModel):
 
 
 class ContractCache:
-    """In-process, thread-safe, LRU, TTL cache for processed contract data."""
+    """In-process, LRU, TTL cache for processed contract data.
+
+    No lock is needed: every operation below runs without an ``await``, so
+    no other coroutine can observe or modify the cache half-way through one.
+    """
 
     def __init__(self) -> None:
-        self._cache: OrderedDict[str, tuple[CachedContract, float]] = OrderedDict()
-        self._lock = anyio.Lock()
+        # Plain dicts keep insertion order, so the first key is the least recently used
+        self._cache: dict[str, tuple[CachedContract, float]] = {}
         self._max_size = config.contracts_cache_max_number
         self._ttl = config.contracts_cache_ttl_seconds
 
     async def get(self, key: str) -> CachedContract | None:
         """Retrieve an entry from the cache if it exists and is fresh."""
-        async with self._lock:
-            if key not in self._cache:
-                return None
-            contract_data, expiry_timestamp = self._cache[key]
-            if time.monotonic() >= expiry_timestamp:
-                self._cache.pop(key)
-                return None
-            self._cache.move_to_end(key)
-            return contract_data
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        contract_data, expiry_timestamp = entry
+        if time.monotonic() >= expiry_timestamp:
+            self._cache.pop(key, None)
+            return None
+        # Re-insert to mark the entry as most recently used, unless it already is
+        if next(reversed(self._cache)) != key:
+            del self._cache[key]
+            self._cache[key] = entry
+        return contract_data
 
     async def set(self, key: str, value: CachedContract) -> None:
         """Add an entry to the cache, enforcing size and TTL."""
-        async with self._lock:
-            expiry_timestamp = time.monotonic() + self._ttl
-            self._cache[key] = (value, expiry_timestamp)
-            self._cache.move_to_end(key)
-            if len(self._cache) > self._max_size:
-                self._cache.popitem(last=False)
+        expiry_timestamp = time.monotonic() + self._ttl
+        # Drop any existing entry first so the new one lands at the end
+        self._cache.pop(key, None)
+        self._cache[key] = (value, expiry_timestamp)
+        while len(self._cache) > self._max_size:
+            del self._cache[next(iter(self._cache))]
 
 
 # Global singleton instance for the contract cache
 contract_cache = ContractCache()
+
+
+class BlockCache:
+    """In-process, LRU, TTL cache for Blockscout block responses.
+
+    Each entry carries its own TTL, so the frequently polled latest block and
+    immutable finalized blocks share one bounded cache. Concurrent misses for
+    the same key are coalesced into a single upstream request. Like the other
+    caches, every mutation runs without an ``await`` in between, so no lock is
+    needed.
+    """
+
+    def __init__(self) -> None:
+        # Plain dicts keep insertion order, so the first key is the least recently used
+        self._cache: dict[tuple[str, str], tuple[Any, float]] = {}
+        self._inflight: dict[tuple[str, str], asyncio.Future[Any]] = {}
+        self._latest_heights: dict[str, int] = {}
+        self._max_size = config.block_cache_max_number
+
+    async def get(self, key: tuple[str, str]) -> Any | None:
+        """Retrieve a response if it is cached and fresh."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        value, expiry_timestamp = entry
+        if time.monotonic() >= expiry_timestamp:
+            self._cache.pop(key, None)
+            return None
+        # Re-insert to mark the entry as most recently used, unless it already is
+        if next(reversed(self._cache)) != key:
+            del self._cache[key]
+            self._cache[key] = entry
+        return value
+
+    async def set(self, key: tuple[str, str], value: Any, ttl: float) -> None:
+        """Cache a response for ``ttl`` seconds, evicting the least recently used entries."""
+        self._cache.pop(key, None)
+        self._cache[key] = (value, time.monotonic() + ttl)
+        while len(self._cache) > self._max_size:
+            del self._cache[next(iter(self._cache))]
+
+    async def get_or_fetch(self, key: tuple[str, str], fetcher: Callable[[], Awaitable[Any]], ttl: float) -> Any:
+        """Return the cached response, running ``fetcher`` once for concurrent misses.
+
+        Callers arriving while a fetch is in flight await the same outcome,
+        including any exception it raises. Failures are not cached.
+        """
+        cached = await self.get(key)
+        if cached is not None:
+            return cached
+        if (inflight := self._inflight.get(key)) is not None:
+            # Shield so a cancelled follower does not cancel the shared fetch
+            return await asyncio.shield(inflight)
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await fetcher()
+            await self.set(key, value, ttl)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark as retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            # The map may have been cleared and refilled while the fetch was running
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    def record_latest_height(self, base_url: str, height: int) -> None:
+        """Remember the highest block seen on a Blockscout instance."""
+        if height > self._latest_heights.get(base_url, -1):
+            self._latest_heights[base_url] = height
+
+    def is_finalized(self, base_url: str, height: int) -> bool:
+        """Return ``True`` if the block is deep enough below the latest known block to be immutable."""
+        latest_height = self._latest_heights.get(base_url)
+        return latest_height is not None and height <= latest_height - config.block_cache_min_confirmations
+
+    def clear(self) -> None:
+        """Drop every cached response, in-flight fetch and known height."""
+        self._cache.clear()
+        self._inflight.clear()
+        self._latest_heights.clear()
+
+
+# Global singleton instance for the block cache
+block_cache = BlockCache()
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import functools
+import operator
+import re
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
+from starlette.datastructures import Headers
+
 from blockscout_mcp_server.config import config
 
 UNDEFINED_CLIENT_NAME = "N/A"
@@ -12,7 +18,21 @@ UNDEFINED_CLIENT_VERSION = "N/A"
 UNKNOWN_PROTOCOL_VERSION = "Unknown"
 
 
-@dataclass
+# First non-empty entry of a comma-separated header value, without surrounding whitespace
+_FIRST_HEADER_ENTRY = re.compile(r"[\s,]*+([^,]*[^\s,])")
+_WHITESPACE_RUN = re.compile(r"\s+")
+
+# str.translate table deleting ASCII control characters (0-31 and DEL)
+_CONTROL_CHARS_TABLE = dict.fromkeys([*range(32), 127])
+
+
+# Attribute walks performed in C; they raise AttributeError on any missing hop.
+# FastMCP's Context raises ValueError instead when used outside of a request.
+_get_client_params = operator.attrgetter("session.client_params")
+_get_request = operator.attrgetter("request_context.request")
+
+
+@dataclass(slots=True)
 class ClientMeta:
     name: str
     version: str
@@ -25,21 +45,39 @@ def get_header_case_insensitive(headers: Any, key: str, default: str = "") -> st
 
     Works with Starlette's `Headers` (already case-insensitive) and plain dicts.
     """
+    if isinstance(headers, Headers):
+        # Request path: a single case-insensitive lookup, no fallback scan
+        return headers.get(key, default)
     try:
-        value = headers.get(key, None)  # type: ignore[call-arg]
-        if value is not None:
-            return value
+        value = headers.get(key)
+        if value is None:
+            value = get_lowercase_headers(headers).get(key.lower())
     except Exception:  # pragma: no cover - tolerate any mapping shape
-        pass
+        return default
+    return default if value is None else value
+
+
+def get_lowercase_headers(headers: Any) -> Mapping[str, str]:
+    """Return a view of request headers that can be queried by lowercase name.
+
+    Starlette's `Headers` already matches names case-insensitively and is returned as is.
+    Other mappings are copied once with lowercased keys so repeated lookups are plain dict hits.
+    """
+    if isinstance(headers, Headers):
+        return headers
     try:
-        lower_key = key.lower()
-        items = headers.items() if hasattr(headers, "items") else []  # type: ignore[assignment]
-        for k, v in items:  # type: ignore[assignment]
-            if isinstance(k, str) and k.lower() == lower_key:
-                return v
+        return {k.lower(): v for k, v in headers.items() if isinstance(k, str)}
     except Exception:  # pragma: no cover - tolerate any mapping shape
-        pass
-    return default
+        return {}
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_allowlist(allowlist_raw: str) -> frozenset[str]:
+    """Parse the comma-separated intermediary allowlist into lowercase entries.
+
+    Cached by the raw config string, so the list is parsed once per distinct value.
+    """
+    return frozenset(stripped.lower() for v in allowlist_raw.split(",") if (stripped := v.strip()))
 
 
 def _parse_intermediary_header(value: str, allowlist_raw: str) -> str:
@@ -51,21 +89,18 @@ def _parse_intermediary_header(value: str, allowlist_raw: str) -> str:
     """
     if not value:
         return ""
-    first_value = next(
-        (stripped for v in value.split(",") if (stripped := v.strip())),
-        "",
-    )
-    if not first_value:
+    match = _FIRST_HEADER_ENTRY.match(value)
+    if match is None:
         return ""
-    normalized = " ".join(first_value.split())
+    normalized = _WHITESPACE_RUN.sub(" ", match.group(1))
     if len(normalized) > 16:
         return ""
     if "/" in normalized:
         return ""
-    if any(ord(c) < 32 or ord(c) == 127 for c in normalized):
+    # A single C-level pass: any deleted control character shortens the string
+    if len(normalized.translate(_CONTROL_CHARS_TABLE)) != len(normalized):
         return ""
-    allowlist = [stripped.lower() for v in allowlist_raw.split(",") if (stripped := v.strip())]
-    if normalized.lower() not in allowlist:
+    if normalized.lower() not in _compile_allowlist(allowlist_raw):
         return ""
     return normalized
 
@@ -86,7 +121,10 @@ def extract_client_meta_from_ctx(ctx: Any) -> ClientMeta:
     intermediary: str = ""
 
     try:
-        client_params = getattr(getattr(ctx, "session", None), "client_params", None)
+        try:
+            client_params = _get_client_params(ctx)
+        except (AttributeError, ValueError):
+            client_params = None
         if client_params is not None:
             # protocolVersion may be missing
             if getattr(client_params, "protocolVersion", None):
@@ -98,14 +136,17 @@ def extract_client_meta_from_ctx(ctx: Any) -> ClientMeta:
                 if getattr(client_info, "version", None):
                     client_version = client_info.version
         # Read User-Agent from HTTP request (if present)
-        request = getattr(getattr(ctx, "request_context", None), "request", None)
+        try:
+            request = _get_request(ctx)
+        except (AttributeError, ValueError):
+            request = None
         if request is not None:
-            headers = request.headers or {}
-            user_agent = get_header_case_insensitive(headers, "user-agent", "")
+            headers = get_lowercase_headers(request.headers or {})
+            user_agent = headers.get("user-agent") or ""
             header_name = config.intermediary_header
             allowlist_raw = config.intermediary_allowlist
             if header_name and allowlist_raw:
-                intermediary_raw = get_header_case_insensitive(headers, header_name, "")
+                intermediary_raw = headers.get(header_name.lower()) or ""
                 intermediary = _parse_intermediary_header(intermediary_raw, allowlist_raw)
         # If client name is still undefined, fallback to User-Agent
         if client_name == UNDEFINED_CLIENT_NAME and user_agent:
@@ -27,6 +27,11 @@ class ServerConfig(BaseSettings):
     contracts_cache_max_number: int = 10  # Default 10 contracts
     contracts_cache_ttl_seconds: int = 3600  # Default 1 hour
 
+    latest_block_cache_ttl_seconds: float = 2.0  # Latest block changes every few seconds
+    block_cache_ttl_seconds: int = 600  # Finalized blocks are immutable; default 10 minutes
+    block_cache_max_number: int = 256
+    block_cache_min_confirmations: int = 64  # Blocks at least this deep are treated as finalized
+
     nft_page_size: int = 10
     logs_page_size: int = 10
     advanced_filters_page_size: int = 10
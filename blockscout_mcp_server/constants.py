@@ -59,7 +59,7 @@ as you learn
 6. Combine approaches - use estimation to get close, then fine-tune with iteration, always learning from each step
 """
 
-RECOMMENDED_CHAINS = [
+RECOMMENDED_CHAINS = (
     {
         "name": "Ethereum",
         "chain_id": "1",
@@ -132,7 +132,7 @@ RECOMMENDED_CHAINS = [
         "ecosystem": "Ethereum",
         "settlement_layer_chain_id": "1",
     },
-]
+)
 
 SERVER_NAME = "blockscout-mcp-server"
 
@@ -143,3 +143,13 @@ LOG_DATA_TRUNCATION_LIMIT = 514
 # The maximum length for a transaction's input data field before it's truncated.
 # 514 = '0x' prefix + 512 hex characters (256 bytes).
 INPUT_DATA_TRUNCATION_LIMIT = 514
+
+# REST API responses smaller than this many bytes are sent uncompressed.
+REST_GZIP_MINIMUM_SIZE = 1024
+
+# gzip level for REST API responses; favours latency over maximum compression.
+REST_GZIP_COMPRESS_LEVEL = 5
+
+# Connection pool limits of the shared HTTP client used for upstream API requests.
+HTTP_MAX_CONNECTIONS = 200
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
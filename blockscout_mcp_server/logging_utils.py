@@ -1,5 +1,6 @@
 """Logging utilities for the Blockscout MCP Server."""
 
+import functools
 import logging
 import sys
 
@@ -7,6 +8,27 @@ import sys
 # This logger is created before any handler manipulation occurs, ensuring safe error reporting
 _module_logger = logging.getLogger(__name__)
 
+# Standard log format that matches our desired output; shared by all replacement handlers
+_STANDARD_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_rich_handler_class(handler_class: type) -> bool:
+    """Return whether a handler class looks like a Rich handler.
+
+    The decision depends only on the class, so it is cached per class rather than
+    recomputed for every handler instance.
+    """
+    handler_class_name = handler_class.__name__
+    handler_module = getattr(handler_class, "__module__", "")
+
+    # Ensure both values are strings before calling .lower()
+    return (isinstance(handler_class_name, str) and "rich" in handler_class_name.lower()) or (
+        isinstance(handler_module, str) and "rich" in handler_module.lower()
+    )
+
 
 def replace_rich_handlers_with_standard() -> None:
     """Replace any Rich logging handlers with standard StreamHandlers.
@@ -14,48 +36,48 @@ def replace_rich_handlers_with_standard() -> None:
     This function scans all existing loggers and replaces Rich handlers
     with standard Python logging StreamHandlers to prevent multi-line
     log formatting that's not suitable for production environments.
+    It returns immediately when the rich package has not been imported.
 
     Note: Uses defensive logging practices to avoid circular dependencies.
     Since this function manipulates the logging system itself, it uses a
     pre-defined module logger and fallback mechanisms to ensure safe error
     reporting even if the logging system is in an inconsistent state.
     """
-    # Standard log format that matches our desired output
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    # Rich handlers can only exist once the rich package has been imported
+    if "rich" not in sys.modules:
+        return
+
+    # Resolved once per call; sys.stderr may be swapped at runtime, so it is not cached globally
+    stderr = sys.stderr
+
+    # Start with the root logger; it is never stored in the manager's loggerDict
+    loggers_to_process = [logging.getLogger()]
+
+    # Add named loggers that own handlers. Entries may be PlaceHolder objects, and
+    # loggers without handlers have nothing to replace, so both are skipped here
+    # instead of being re-fetched through logging.getLogger().
+    loggers_to_process.extend(
+        logger
+        for logger in list(logging.Logger.manager.loggerDict.values())
+        if isinstance(logger, logging.Logger) and logger.handlers
     )
 
-    # Get all existing loggers
-    loggers_to_process = [logging.getLogger()]  # Start with root logger
-
-    # Add all named loggers
-    for name in logging.Logger.manager.loggerDict:
-        logger = logging.getLogger(name)
-        if logger != logging.getLogger():  # Skip root logger (already added)
-            loggers_to_process.append(logger)
-
     handlers_replaced = 0
 
     for logger in loggers_to_process:
         # Check each handler to see if it's a Rich handler
         handlers_to_replace = []
 
-        for handler in logger.handlers[:]:  # Copy list to avoid modification during iteration
+        for handler in logger.handlers:  # Read-only pass; replacements are applied below
             # Check if this is a Rich handler by looking at the class name or module
             try:
-                handler_class_name = handler.__class__.__name__
-                handler_module = getattr(handler.__class__, "__module__", "")
-
-                # Ensure both values are strings before calling .lower()
-                if (isinstance(handler_class_name, str) and "rich" in handler_class_name.lower()) or (
-                    isinstance(handler_module, str) and "rich" in handler_module.lower()
-                ):
+                if _is_rich_handler_class(handler.__class__):
                     handlers_to_replace.append(handler)
             except (AttributeError, TypeError, ValueError) as e:
                 # If handler has unexpected attributes or missing properties, skip it gracefully
                 # This ensures we continue processing other handlers even if one is problematic
                 try:
-                    _module_logger.debug(f"Skipping handler inspection due to error: {e}")
+                    _module_logger.debug("Skipping handler inspection due to error: %s", e)
                 except Exception:
                     # Fallback if logging system is unstable - use direct stderr output
                     print(f"Warning: Skipping handler inspection due to error: {e}", file=sys.stderr)
@@ -68,9 +90,9 @@ def replace_rich_handlers_with_standard() -> None:
                 logger.removeHandler(rich_handler)
 
                 # Create a replacement StreamHandler
-                new_handler = logging.StreamHandler(sys.stderr)
+                new_handler = logging.StreamHandler(stderr)
                 new_handler.setLevel(rich_handler.level)
-                new_handler.setFormatter(formatter)
+                new_handler.setFormatter(_STANDARD_FORMATTER)
 
                 # Add the new handler
                 logger.addHandler(new_handler)
@@ -82,7 +104,7 @@ def replace_rich_handlers_with_standard() -> None:
                 # - OSError: Permission issues or file system problems
                 # - RuntimeError: Threading issues or handler state conflicts
                 try:
-                    _module_logger.warning(f"Failed to replace Rich handler {rich_handler}: {e}")
+                    _module_logger.warning("Failed to replace Rich handler %s: %s", rich_handler, e)
                 except Exception:
                     # Fallback if logging system is unstable - use direct stderr output
                     print(f"Warning: Failed to replace Rich handler {rich_handler}: {e}", file=sys.stderr)
@@ -91,7 +113,7 @@ def replace_rich_handlers_with_standard() -> None:
     if handlers_replaced > 0:
         # Use the pre-defined module logger to report success
         try:
-            _module_logger.info(f"Replaced {handlers_replaced} Rich logging handlers with standard handlers")
+            _module_logger.info("Replaced %d Rich logging handlers with standard handlers", handlers_replaced)
         except Exception:
             # Fallback if logging system is unstable - use direct stderr output
             print(f"Info: Replaced {handlers_replaced} Rich logging handlers with standard handlers", file=sys.stderr)
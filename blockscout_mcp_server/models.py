@@ -2,7 +2,7 @@
 
 from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 # --- Generic Type Variable ---
 T = TypeVar("T")
@@ -36,6 +36,9 @@ class LatestBlockData(BaseModel):
 class ChainInfo(BaseModel):
     """Represents a blockchain with its essential identifiers."""
 
+    # Instances are shared between tool calls, so they must not be mutated
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(description="The common name of the blockchain (e.g., 'Ethereum').")
     chain_id: str = Field(description="The unique identifier for the chain.")
     is_testnet: bool = Field(description="Indicates if the chain is a testnet.")
@@ -53,6 +56,8 @@ class ChainInfo(BaseModel):
 class ChainIdGuidance(BaseModel):
     """A structured representation of chain ID guidance combining rules and recommendations."""
 
+    model_config = ConfigDict(frozen=True)
+
     rules: str = Field(description="Rules for chain ID selection and usage.")
     recommended_chains: list[ChainInfo] = Field(
         description="A list of popular chains with their names and IDs, useful for quick lookups."
@@ -62,6 +67,8 @@ class ChainIdGuidance(BaseModel):
 class InstructionsData(BaseModel):
     """A structured representation of the server's operational instructions."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(description="The version of the Blockscout MCP server.")
     error_handling_rules: str = Field(description="Rules for handling network errors and retries.")
     chain_id_guidance: ChainIdGuidance = Field(description="Comprehensive guidance for chain ID selection and usage.")
@@ -372,3 +379,9 @@ class BlockInfoData(BaseModel):
     transaction_hashes: list[str] | None = Field(
         None, description="A list of transaction hashes included in the block."
     )
+
+
+# --- Prebuilt validators for paginated list payloads ---
+# A TypeAdapter validates a whole page in one core call instead of one model call per item.
+TRANSACTION_LOG_ITEMS_ADAPTER = TypeAdapter(list[TransactionLogItem])
+ADVANCED_FILTER_ITEMS_ADAPTER = TypeAdapter(list[AdvancedFilterItem])
@@ -1,3 +1,5 @@
+import functools
+import os
 from typing import Annotated
 
 import typer
@@ -24,6 +26,7 @@ from blockscout_mcp_server.tools.address_tools import (
 )
 from blockscout_mcp_server.tools.block_tools import get_block_info, get_latest_block
 from blockscout_mcp_server.tools.chains_tools import get_chains_list
+from blockscout_mcp_server.tools.common import close_httpx_client
 from blockscout_mcp_server.tools.contract_tools import (
     get_contract_abi,
     inspect_contract_code,
@@ -77,35 +80,81 @@ Here is the list of IDs of most popular chains:
 </efficiency_optimization_rules>
 """
 
-mcp = FastMCP(name=SERVER_NAME, instructions=composed_instructions)
-
-
-# Register the tools
-# The name of each tool will be its function name
-# The description will be taken from the function's docstring
-# The arguments (name, type, description) will be inferred from type hints
-# TODO: structured_output is disabled for all tools so far to preserve the LLM context since it adds to the `list/tools` response ~20K tokens.  # noqa: E501
-mcp.tool(structured_output=False)(__unlock_blockchain_analysis__)
-mcp.tool(structured_output=False)(get_block_info)
-mcp.tool(structured_output=False)(get_latest_block)
-mcp.tool(structured_output=False)(get_address_by_ens_name)
-mcp.tool(structured_output=False)(get_transactions_by_address)
-mcp.tool(structured_output=False)(get_token_transfers_by_address)
-mcp.tool(structured_output=False)(lookup_token_by_symbol)
-mcp.tool(structured_output=False)(get_contract_abi)
-mcp.tool(structured_output=False)(inspect_contract_code)
-mcp.tool(structured_output=False)(read_contract)
-mcp.tool(structured_output=False)(get_address_info)
-mcp.tool(structured_output=False)(get_tokens_by_address)
-mcp.tool(structured_output=False)(transaction_summary)
-mcp.tool(structured_output=False)(nft_tokens_by_address)
-mcp.tool(structured_output=False)(get_transaction_info)
-mcp.tool(structured_output=False)(get_transaction_logs)
-mcp.tool(structured_output=False)(get_chains_list)
-
-
-# Initialize logging and override the rich formatter defined in the FastMCP
-replace_rich_handlers_with_standard()
+# Tools exposed by the server, in registration order
+_TOOLS = (
+    __unlock_blockchain_analysis__,
+    get_block_info,
+    get_latest_block,
+    get_address_by_ens_name,
+    get_transactions_by_address,
+    get_token_transfers_by_address,
+    lookup_token_by_symbol,
+    get_contract_abi,
+    inspect_contract_code,
+    read_contract,
+    get_address_info,
+    get_tokens_by_address,
+    transaction_summary,
+    nft_tokens_by_address,
+    get_transaction_info,
+    get_transaction_logs,
+    get_chains_list,
+)
+
+
+@functools.cache
+def get_mcp() -> FastMCP:
+    """Build the FastMCP server with all tools registered.
+
+    The server is created on first use, so importing this module does not
+    register tools or reconfigure logging.
+    """
+    mcp = FastMCP(name=SERVER_NAME, instructions=composed_instructions)
+
+    # Register the tools
+    # The name of each tool will be its function name
+    # The description will be taken from the function's docstring
+    # The arguments (name, type, description) will be inferred from type hints
+    # TODO: structured_output is disabled for all tools so far to preserve the LLM context since it adds to the `list/tools` response ~20K tokens.  # noqa: E501
+    # The decorator returned by mcp.tool() holds no per-tool state, so one instance registers every tool
+    register_tool = mcp.tool(structured_output=False)
+    for tool in _TOOLS:
+        register_tool(tool)
+
+    # Initialize logging and override the rich formatter defined in the FastMCP
+    replace_rich_handlers_with_standard()
+
+    return mcp
+
+
+# Tells HTTP worker processes started by uvicorn whether to register the REST API
+_REST_API_ENV_VAR = "BLOCKSCOUT_MCP_REST_API_ENABLED"
+
+
+def _build_http_app(rest: bool):
+    """Configure the MCP server for stateless HTTP and return its ASGI app."""
+    mcp = get_mcp()
+    if rest:
+        from blockscout_mcp_server.api.routes import register_api_routes
+
+        register_api_routes(mcp)
+
+    # Configure the existing 'mcp' instance for stateless HTTP with JSON responses
+    mcp.settings.stateless_http = True  # Enable stateless mode
+    mcp.settings.json_response = True  # Enable JSON responses instead of SSE for tool calls
+    # Enable analytics in HTTP mode
+    analytics.set_http_mode(True)
+    asgi_app = mcp.streamable_http_app()
+    asgi_app.add_event_handler("shutdown", analytics.flush_pending_events)
+    asgi_app.add_event_handler("shutdown", WEB3_POOL.close)
+    asgi_app.add_event_handler("shutdown", close_httpx_client)
+    return asgi_app
+
+
+def create_http_app():
+    """ASGI app factory used by uvicorn worker processes when --workers is greater than 1."""
+    return _build_http_app(rest=os.environ.get(_REST_API_ENV_VAR) == "1")
+
 
 # Create a Typer application for our CLI
 cli_app = typer.Typer()
@@ -119,6 +168,15 @@ def main_command(
         str, typer.Option("--http-host", help="Host for HTTP server if --http is used.")
     ] = "127.0.0.1",
     http_port: Annotated[int, typer.Option("--http-port", help="Port for HTTP server if --http is used.")] = 8000,
+    proxy_headers: Annotated[
+        bool,
+        typer.Option(
+            "--proxy-headers", help="Trust X-Forwarded-* headers for the client address and scheme if --http is used."
+        ),
+    ] = False,
+    workers: Annotated[
+        int, typer.Option("--workers", min=1, help="Number of HTTP worker processes if --http is used.")
+    ] = 1,
 ):
     """Blockscout MCP Server. Runs in stdio mode by default.
     Use --http to enable HTTP Streamable mode.
@@ -127,25 +185,34 @@ def main_command(
     if http:
         if rest:
             print(f"Starting Blockscout MCP Server with REST API on {http_host}:{http_port}")
-            from blockscout_mcp_server.api.routes import register_api_routes
-
-            register_api_routes(mcp)
         else:
             print(f"Starting Blockscout MCP Server in HTTP Streamable mode on {http_host}:{http_port}")
 
-        # Configure the existing 'mcp' instance for stateless HTTP with JSON responses
-        mcp.settings.stateless_http = True  # Enable stateless mode
-        mcp.settings.json_response = True  # Enable JSON responses instead of SSE for tool calls
-        # Enable analytics in HTTP mode
-        analytics.set_http_mode(True)
-        asgi_app = mcp.streamable_http_app()
-        asgi_app.add_event_handler("shutdown", WEB3_POOL.close)
-        uvicorn.run(asgi_app, host=http_host, port=http_port)
+        if workers > 1:
+            # Worker processes build their own app through the factory, so the app is passed as an import string
+            os.environ[_REST_API_ENV_VAR] = "1" if rest else "0"
+            app = "blockscout_mcp_server.server:create_http_app"
+        else:
+            app = _build_http_app(rest)
+
+        # uvicorn selects uvloop and httptools automatically when the "speedups" extra is installed
+        # Tool calls are logged by the server itself, so uvicorn's per-request access log and headers are disabled
+        uvicorn.run(
+            app,
+            host=http_host,
+            port=http_port,
+            factory=workers > 1,
+            workers=workers,
+            access_log=False,
+            proxy_headers=proxy_headers,
+            server_header=False,
+            date_header=False,
+        )
     elif rest:
         raise typer.BadParameter("The --rest flag can only be used with the --http flag.")
     else:
         # This is the original behavior: run in stdio mode
-        mcp.run()
+        get_mcp().run()
 
 
 def run_server_cli():
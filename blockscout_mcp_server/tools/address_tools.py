@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 from typing import Annotated
 
 from mcp.server.fastmcp import Context
@@ -8,11 +9,9 @@ from blockscout_mcp_server.config import config
 from blockscout_mcp_server.models import (
     AddressInfoData,
     AddressLogItem,
-    NextCallInfo,
     NftCollectionHolding,
     NftCollectionInfo,
     NftTokenInstance,
-    PaginationInfo,
     TokenHoldingData,
     ToolResponse,
 )
@@ -20,8 +19,8 @@ from blockscout_mcp_server.tools.common import (
     _process_and_truncate_log_items,
     apply_cursor_to_params,
     build_tool_response,
+    create_cursor_pagination,
     create_items_pagination,
-    encode_cursor,
     extract_log_cursor_params,
     get_blockscout_base_url,
     make_blockscout_request,
@@ -30,6 +29,23 @@ from blockscout_mcp_server.tools.common import (
 )
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 
+_ADDRESS_LOGS_DATA_DESCRIPTION: tuple[str, ...] = (
+    "Items Structure:",
+    "- `block_number`: Block where the event was emitted",
+    "- `transaction_hash`: Transaction that triggered the event",
+    "- `index`: Log position within the block",
+    "- `topics`: Raw indexed event parameters (first topic is event signature hash)",
+    "- `data`: Raw non-indexed event parameters (hex encoded). **May be truncated.**",
+    "- `data_truncated`: (Optional) `true` if the `data` or `decoded` field was shortened.",
+    "Event Decoding in `decoded` field:",
+    (
+        "- `method_call`: **Actually the event signature** "
+        '(e.g., "Transfer(address indexed from, address indexed to, uint256 value)")'
+    ),
+    "- `method_id`: **Actually the event signature hash** (first 4 bytes of keccak256 hash)",
+    "- `parameters`: Decoded event parameters with names, types, values, and indexing status",
+)
+
 
 @log_tool_invocation
 async def get_address_info(
@@ -60,14 +76,23 @@ async def get_address_info(
     metadata_api_path = "/api/v1/metadata"
     metadata_params = {"addresses": address, "chainId": chain_id}
 
-    address_info_result, metadata_result = await asyncio.gather(
-        make_blockscout_request(base_url=base_url, api_path=blockscout_api_path),
-        make_metadata_request(api_path=metadata_api_path, params=metadata_params),
-        return_exceptions=True,
-    )
-
-    if isinstance(address_info_result, Exception):
-        raise address_info_result
+    # The metadata is optional, so it is fetched in the background and cancelled
+    # as soon as the primary request fails instead of running to completion
+    metadata_task = asyncio.create_task(make_metadata_request(api_path=metadata_api_path, params=metadata_params))
+    try:
+        address_info_result = await make_blockscout_request(base_url=base_url, api_path=blockscout_api_path)
+    except BaseException:
+        metadata_task.cancel()
+        # The metadata task may already have failed, so its outcome is retrieved
+        # here to keep asyncio from logging it as never retrieved
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await metadata_task
+        raise
+
+    try:
+        metadata_result = await metadata_task
+    except Exception as e:
+        metadata_result = e
 
     await report_and_log_progress(ctx, progress=2.0, total=3.0, message="Fetched basic address info.")
 
@@ -75,12 +100,12 @@ async def get_address_info(
     if isinstance(metadata_result, Exception):
         notes = [f"Could not retrieve address metadata. The 'metadata' field is null. Error: {metadata_result}"]
         metadata_data = None
-    elif metadata_result.get("addresses"):
-        address_key = next(
-            (key for key in metadata_result["addresses"] if key.lower() == address.lower()),
-            None,
-        )
-        metadata_data = metadata_result["addresses"].get(address_key) if address_key else None
+    elif addresses := metadata_result.get("addresses"):
+        # The metadata service usually echoes the queried spelling; fall back to a case-insensitive scan
+        metadata_data = addresses.get(address)
+        if metadata_data is None:
+            lower_address = address.lower()
+            metadata_data = next((value for key, value in addresses.items() if key.lower() == lower_address), None)
     else:
         metadata_data = None
 
@@ -133,10 +158,11 @@ async def get_tokens_by_address(
     items_data = response_data.get("items", [])
     token_holdings = []
     for item in items_data:
-        # To preserve the LLM context, only specific fields are added to the response
-        token = item.get("token", {})
+        # To preserve the LLM context, only specific fields are added to the response.
+        # Every field is a Blockscout string (or a "" / None default), so validation is skipped.
+        token = item.get("token") or {}
         token_holdings.append(
-            TokenHoldingData(
+            TokenHoldingData.model_construct(
                 address=token.get("address_hash", ""),
                 name=token.get("name") or "",
                 symbol=token.get("symbol") or "",
@@ -152,22 +178,48 @@ async def get_tokens_by_address(
     # Since there could be more than one page of tokens for the same address,
     # the pagination information is extracted from API response and added explicitly
     # to the tool response
-    pagination = None
-    next_page_params = response_data.get("next_page_params")
-    if next_page_params:
-        next_cursor = encode_cursor(next_page_params)
-        pagination = PaginationInfo(
-            next_call=NextCallInfo(
-                tool_name="get_tokens_by_address",
-                params={
-                    "chain_id": chain_id,
-                    "address": address,
-                    "cursor": next_cursor,
-                },
+    pagination = create_cursor_pagination(
+        tool_name="get_tokens_by_address",
+        next_call_base_params={"chain_id": chain_id, "address": address},
+        next_page_params=response_data.get("next_page_params"),
+    )
+
+    return build_tool_response(data=token_holdings, pagination=pagination)
+
+
+def _build_nft_holding(item: dict) -> NftCollectionHolding:
+    """Build an NFT holding from a Blockscout collection item.
+
+    To preserve the LLM context, only specific fields of the collection and its
+    token instances are added to the response.
+    """
+    token = item.get("token") or {}
+    token_instances = []
+    for instance in item.get("token_instances") or ():
+        metadata = instance.get("metadata") or {}
+        token_instances.append(
+            NftTokenInstance(
+                id=instance.get("id", ""),
+                name=metadata.get("name"),
+                description=metadata.get("description"),
+                image_url=metadata.get("image_url"),
+                external_app_url=metadata.get("external_url"),
+                metadata_attributes=metadata.get("attributes"),
             )
         )
 
-    return build_tool_response(data=token_holdings, pagination=pagination)
+    return NftCollectionHolding(
+        collection=NftCollectionInfo(
+            type=token.get("type", ""),
+            address=token.get("address_hash", ""),
+            name=token.get("name"),
+            symbol=token.get("symbol"),
+            holders_count=token.get("holders_count") or 0,
+            total_supply=token.get("total_supply") or 0,
+        ),
+        amount=item.get("amount", ""),
+        token_instances=token_instances,
+    )
 
 
 def extract_nft_cursor_params(item: dict) -> dict:
@@ -177,7 +229,7 @@ def extract_nft_cursor_params(item: dict) -> dict:
     as cursor parameters for the next page request. The returned dictionary
     will be encoded as an opaque cursor string.
     """
-    token_info = item.get("token", {})
+    token_info = item.get("token") or {}
     return {
         "token_contract_address_hash": token_info.get("address_hash"),
         "token_type": token_info.get("type"),
@@ -221,51 +273,10 @@ async def nft_tokens_by_address(
 
     await report_and_log_progress(ctx, progress=2.0, total=2.0, message="Successfully fetched NFT data.")
 
-    # Process all items first to prepare for pagination
-    original_items = response_data.get("items", [])
-    processed_items = []
-
-    for item in original_items:
-        token = item.get("token", {})
-
-        token_instances = []
-        for instance in item.get("token_instances", []):
-            # To preserve the LLM context, only specific fields for NFT instances are
-            # added to the response
-            metadata = instance.get("metadata", {}) or {}
-            token_instances.append(
-                {
-                    "id": instance.get("id", ""),
-                    "name": metadata.get("name"),
-                    "description": metadata.get("description"),
-                    "image_url": metadata.get("image_url"),
-                    "external_app_url": metadata.get("external_url"),
-                    "metadata_attributes": metadata.get("attributes"),
-                }
-            )
-
-        # To preserve the LLM context, only specific fields for NFT collections are
-        # added to the response
-        collection_info = {
-            "type": token.get("type", ""),
-            "address": token.get("address_hash", ""),
-            "name": token.get("name"),
-            "symbol": token.get("symbol"),
-            "holders_count": token.get("holders_count") or 0,
-            "total_supply": token.get("total_supply") or 0,
-        }
-
-        processed_item = {
-            "token": token,  # Keep original token info for cursor extraction
-            "amount": item.get("amount", ""),
-            "token_instances": token_instances,
-            "collection_info": collection_info,
-        }
-        processed_items.append(processed_item)
-
-    # Use create_items_pagination helper to handle slicing and pagination
+    # Slice the raw items first so only the returned page is shaped into models;
+    # the cursor is extracted from the raw `token` field
     sliced_items, pagination = create_items_pagination(
-        items=processed_items,
+        items=response_data.get("items", []),
         page_size=config.nft_page_size,
         tool_name="nft_tokens_by_address",
         next_call_base_params={
@@ -276,18 +287,7 @@ async def nft_tokens_by_address(
         force_pagination=False,
     )
 
-    # Convert sliced items to NftCollectionHolding objects
-    nft_holdings: list[NftCollectionHolding] = []
-    for item in sliced_items:
-        collection_info = NftCollectionInfo(**item["collection_info"])
-        token_instances = [NftTokenInstance(**instance) for instance in item["token_instances"]]
-        nft_holdings.append(
-            NftCollectionHolding(
-                collection=collection_info,
-                amount=item["amount"],
-                token_instances=token_instances,
-            )
-        )
+    nft_holdings = [_build_nft_holding(item) for item in sliced_items]
 
     return build_tool_response(data=nft_holdings, pagination=pagination)
 
@@ -344,39 +344,6 @@ async def get_address_logs(
 
     original_items, was_truncated = _process_and_truncate_log_items(response_data.get("items", []))
 
-    log_items_dicts: list[dict] = []
-    # To preserve the LLM context, only specific fields are added to the response
-    for item in original_items:
-        curated_item = {
-            "block_number": item.get("block_number"),
-            "transaction_hash": item.get("transaction_hash"),
-            "topics": item.get("topics"),
-            "data": item.get("data"),
-            "decoded": item.get("decoded"),
-            "index": item.get("index"),
-        }
-        if item.get("data_truncated"):
-            curated_item["data_truncated"] = True
-
-        log_items_dicts.append(curated_item)
-
-    data_description = [
-        "Items Structure:",
-        "- `block_number`: Block where the event was emitted",
-        "- `transaction_hash`: Transaction that triggered the event",
-        "- `index`: Log position within the block",
-        "- `topics`: Raw indexed event parameters (first topic is event signature hash)",
-        "- `data`: Raw non-indexed event parameters (hex encoded). **May be truncated.**",
-        "- `data_truncated`: (Optional) `true` if the `data` or `decoded` field was shortened.",
-        "Event Decoding in `decoded` field:",
-        (
-            "- `method_call`: **Actually the event signature** "
-            '(e.g., "Transfer(address indexed from, address indexed to, uint256 value)")'
-        ),
-        "- `method_id`: **Actually the event signature hash** (first 4 bytes of keccak256 hash)",
-        "- `parameters`: Decoded event parameters with names, types, values, and indexing status",
-    ]
-
     notes = None
     if was_truncated:
         notes = [
@@ -393,18 +360,33 @@ async def get_address_logs(
         ]
 
     sliced_items, pagination = create_items_pagination(
-        items=log_items_dicts,
+        items=original_items,
         page_size=config.logs_page_size,
         tool_name="get_address_logs",
         next_call_base_params={"chain_id": chain_id, "address": address},
         cursor_extractor=extract_log_cursor_params,
     )
 
-    sliced_log_items = [AddressLogItem(**item) for item in sliced_items]
+    # To preserve the LLM context, only specific fields are added to the response.
+    # Blockscout already returns these fields with the model's types, so validation is skipped.
+    sliced_log_items = []
+    for item in sliced_items:
+        extra = {"data_truncated": True} if item.get("data_truncated") else {}
+        sliced_log_items.append(
+            AddressLogItem.model_construct(
+                block_number=item.get("block_number"),
+                transaction_hash=item.get("transaction_hash"),
+                topics=item.get("topics"),
+                data=item.get("data"),
+                decoded=item.get("decoded"),
+                index=item.get("index"),
+                **extra,
+            )
+        )
 
     return build_tool_response(
         data=sliced_log_items,
-        data_description=data_description,
+        data_description=_ADDRESS_LOGS_DATA_DESCRIPTION,
         notes=notes,
         pagination=pagination,
     )
@@ -1,9 +1,11 @@
 import asyncio
-from typing import Annotated
+from typing import Annotated, Any
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
+from blockscout_mcp_server.cache import block_cache
+from blockscout_mcp_server.config import config
 from blockscout_mcp_server.models import BlockInfoData, LatestBlockData, ToolResponse
 from blockscout_mcp_server.tools.common import (
     build_tool_response,
@@ -14,6 +16,24 @@ from blockscout_mcp_server.tools.common import (
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 
 
+async def _fetch_block_data(base_url: str, api_path: str) -> tuple[Any, bool]:
+    """Return a block response and whether it came from the cache rather than Blockscout."""
+    cached = await block_cache.get((base_url, api_path))
+    if cached is not None:
+        return cached, True
+    return await make_blockscout_request(base_url=base_url, api_path=api_path), False
+
+
+async def _cache_if_finalized(base_url: str, block_data: Any, responses: dict[str, Any]) -> None:
+    """Cache freshly fetched block responses once the block is deep enough to be immutable."""
+    if not responses or not isinstance(block_data, dict):
+        return
+    height = block_data.get("height")
+    if isinstance(height, int) and block_cache.is_finalized(base_url, height):
+        for api_path, response in responses.items():
+            await block_cache.set((base_url, api_path), response, config.block_cache_ttl_seconds)
+
+
 @log_tool_invocation
 async def get_block_info(
     chain_id: Annotated[str, Field(description="The ID of the blockchain")],
@@ -45,8 +65,13 @@ async def get_block_info(
         message="Resolved Blockscout instance URL. Fetching block data...",
     )
 
+    block_api_path = f"/api/v2/blocks/{number_or_hash}"
+
     if not include_transactions:
-        response_data = await make_blockscout_request(base_url=base_url, api_path=f"/api/v2/blocks/{number_or_hash}")
+        response_data, from_cache = await _fetch_block_data(base_url, block_api_path)
+        # Cache hits are not stored again, so their TTL is not extended
+        if not from_cache:
+            await _cache_if_finalized(base_url, response_data, {block_api_path: response_data})
         await report_and_log_progress(
             ctx,
             progress=2.0,
@@ -56,12 +81,11 @@ async def get_block_info(
         block_data = BlockInfoData(block_details=response_data)
         return build_tool_response(data=block_data)
 
-    block_api_path = f"/api/v2/blocks/{number_or_hash}"
     txs_api_path = f"/api/v2/blocks/{number_or_hash}/transactions"
 
     results = await asyncio.gather(
-        make_blockscout_request(base_url=base_url, api_path=block_api_path),
-        make_blockscout_request(base_url=base_url, api_path=txs_api_path),
+        _fetch_block_data(base_url, block_api_path),
+        _fetch_block_data(base_url, txs_api_path),
         return_exceptions=True,
     )
     await report_and_log_progress(
@@ -71,18 +95,27 @@ async def get_block_info(
         message="Fetched block and transaction data.",
     )
 
-    block_info_result, txs_result = results
+    block_fetch, txs_fetch = results
     notes = None
 
-    if isinstance(block_info_result, Exception):
-        raise block_info_result
+    if isinstance(block_fetch, Exception):
+        raise block_fetch
+
+    block_info_result, block_from_cache = block_fetch
+    # Cache hits are not stored again, so their TTL is not extended
+    fresh_responses = {} if block_from_cache else {block_api_path: block_info_result}
 
     tx_hashes = None
-    if isinstance(txs_result, Exception):
-        notes = [f"Could not retrieve the list of transactions for this block. Error: {txs_result}"]
+    if isinstance(txs_fetch, Exception):
+        notes = [f"Could not retrieve the list of transactions for this block. Error: {txs_fetch}"]
     else:
+        txs_result, txs_from_cache = txs_fetch
         tx_items = txs_result.get("items", [])
         tx_hashes = [tx.get("hash") for tx in tx_items if tx.get("hash")]
+        if not txs_from_cache:
+            fresh_responses[txs_api_path] = txs_result
+
+    await _cache_if_finalized(base_url, block_info_result, fresh_responses)
 
     await report_and_log_progress(
         ctx,
@@ -126,7 +159,13 @@ async def get_latest_block(
         message="Resolved Blockscout instance URL. Fetching latest block data...",
     )
 
-    response_data = await make_blockscout_request(base_url=base_url, api_path=api_path)
+    # The latest block is a natural polling target, so repeated calls within a
+    # couple of seconds share one upstream request
+    response_data = await block_cache.get_or_fetch(
+        (base_url, api_path),
+        lambda: make_blockscout_request(base_url=base_url, api_path=api_path),
+        config.latest_block_cache_ttl_seconds,
+    )
 
     # Report completion
     await report_and_log_progress(
@@ -139,6 +178,8 @@ async def get_latest_block(
     # The API returns a list. Extract data from the first item
     if response_data and isinstance(response_data, list) and len(response_data) > 0:
         first_block = response_data[0]
+        if isinstance(height := first_block.get("height"), int):
+            block_cache.record_latest_height(base_url, height)
         # The main idea of this tool is to provide the latest block number of the chain.
         # The timestamp is provided to be used as a reference timestamp for other API calls.
         block_data = LatestBlockData(
@@ -1,8 +1,10 @@
+import asyncio
 import base64
+import functools
 import json
 import logging
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any
 
 import anyio
@@ -12,11 +14,18 @@ from mcp.server.fastmcp import Context
 from blockscout_mcp_server.cache import ChainCache, ChainsListCache
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import (
+    HTTP_MAX_CONNECTIONS,
+    HTTP_MAX_KEEPALIVE_CONNECTIONS,
     INPUT_DATA_TRUNCATION_LIMIT,
     LOG_DATA_TRUNCATION_LIMIT,
 )
 from blockscout_mcp_server.models import NextCallInfo, PaginationInfo, ToolResponse
 
+try:
+    import h2  # noqa: F401 - only its presence matters; httpx imports it when HTTP/2 is enabled
+except ImportError:  # pragma: no cover - h2 is an optional speedup
+    h2 = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +45,65 @@ def _create_httpx_client(*, timeout: float, headers: dict | None = None) -> http
         automatically handle HTTP redirects.
     """
 
-    return httpx.AsyncClient(timeout=timeout, follow_redirects=True, headers=headers or {})
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        headers=headers or {},
+        # Multiplex concurrent requests to the same host over one connection when h2 is installed
+        http2=h2 is not None,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+    )
+
+
+# The pooled client and the event loop it belongs to
+_shared_httpx_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
+
+
+def _get_httpx_client() -> httpx.AsyncClient:
+    """Return the pooled AsyncClient shared by the upstream request helpers.
+
+    Reusing one client keeps connections to upstream APIs alive between tool
+    calls instead of paying a TCP/TLS handshake per request. Connections are
+    bound to an event loop, so a new client is created if the loop changes.
+    Callers pass their own timeout on each request.
+    """
+    global _shared_httpx_client
+    loop = asyncio.get_running_loop()
+    if _shared_httpx_client is not None:
+        client_loop, client = _shared_httpx_client
+        if not client.is_closed:
+            if client_loop is loop:
+                return client
+            _discard_httpx_client(client_loop, client)
+    client = _create_httpx_client(timeout=config.bs_timeout)
+    _shared_httpx_client = (loop, client)
+    return client
+
+
+def _discard_httpx_client(loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+    """Release a pooled client that belongs to another event loop.
+
+    Its connections can only be closed on the loop that opened them, so the
+    close is scheduled there while that loop still runs. Otherwise the client
+    is dropped and its sockets are released when it is garbage collected.
+    """
+    if loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        logger.debug("Dropping the pooled httpx client of an event loop that is no longer running")
+
+
+async def close_httpx_client() -> None:
+    """Close the pooled AsyncClient, if one was created."""
+    global _shared_httpx_client
+    if _shared_httpx_client is None:
+        return
+    _, client = _shared_httpx_client
+    _shared_httpx_client = None
+    await client.aclose()
 
 
 def find_blockscout_url(chain_data: dict) -> str | None:
@@ -80,20 +147,21 @@ async def get_blockscout_base_url(chain_id: str) -> str:
         await chain_cache.set(chain_id, config.settlemint_blockscout_url)
         return config.settlemint_blockscout_url
     
-    current_time = time.monotonic()
-    cached_entry = chain_cache.get(chain_id)
-
-    if cached_entry:
-        cached_url, expiry_timestamp = cached_entry
-        if current_time < expiry_timestamp:
-            if cached_url is None:  # Cached "not found"
-                raise ChainNotFoundError(
-                    f"Blockscout instance hosted by Blockscout team for chain ID '{chain_id}' is unknown (cached)."
-                )
-            return cached_url
-        else:
-            await chain_cache.invalidate(chain_id)  # Cache expired
+    # Expired URLs are served stale while the cache refreshes them in the background;
+    # concurrent misses for the same chain share a single Chainscout lookup
+    blockscout_url = await chain_cache.get_or_fetch(chain_id, lambda: _fetch_blockscout_url(chain_id))
+
+    if blockscout_url:
+        return blockscout_url
+    raise ChainNotFoundError(f"Blockscout instance hosted by Blockscout team for chain ID '{chain_id}' is unknown.")
 
+
+async def _fetch_blockscout_url(chain_id: str) -> str | None:
+    """Look up the Blockscout URL for ``chain_id`` on Chainscout.
+
+    Returns ``None`` when the chain is known but has no Blockscout-hosted explorer.
+    Definitive "not found" answers are cached as failures before raising.
+    """
     chain_api_url = f"{config.chainscout_url}/api/chains/{chain_id}"
 
     # Note: We're not using make_chainscout_request here because we need:
@@ -102,8 +170,7 @@ async def get_blockscout_base_url(chain_id: str) -> str:
     # 3. Direct access to handle JSON parsing errors
     # 4. Chain-specific context in error messages
     try:
-        async with _create_httpx_client(timeout=config.chainscout_timeout, headers=None) as client:
-            response = await client.get(chain_api_url)
+        response = await _get_httpx_client().get(chain_api_url, timeout=config.chainscout_timeout)
         response.raise_for_status()
         chain_data = response.json()
     except httpx.HTTPStatusError as e:
@@ -118,12 +185,7 @@ async def get_blockscout_base_url(chain_id: str) -> str:
         await chain_cache.set_failure(chain_id)
         raise ChainNotFoundError(f"No explorer data found for chain ID '{chain_id}' on Chainscout.")
 
-    blockscout_url = find_blockscout_url(chain_data)
-    await chain_cache.set(chain_id, blockscout_url)
-
-    if blockscout_url:
-        return blockscout_url
-    raise ChainNotFoundError(f"Blockscout instance hosted by Blockscout team for chain ID '{chain_id}' is unknown.")
+    return find_blockscout_url(chain_data)
 
 
 async def make_blockscout_request(base_url: str, api_path: str, params: dict | None = None) -> dict:
@@ -156,36 +218,36 @@ async def make_blockscout_request(base_url: str, api_path: str, params: dict | N
         network conditions. Centralizing minimal retries here improves robustness
         for all tools and REST endpoints without masking persistent API errors.
     """
-    async with _create_httpx_client(timeout=config.bs_timeout, headers=None) as client:
-        if params is None:
-            params = {}
-        if config.bs_api_key:
-            params["apikey"] = config.bs_api_key
-        
-        # Add SettleMint authentication as query parameter if accessing SettleMint URL
-        if (config.settlemint_blockscout_url and 
-            config.settlemint_application_access_token and 
-            base_url.rstrip('/') == config.settlemint_blockscout_url.rstrip('/')):
-            params['token'] = config.settlemint_application_access_token
-
-        url = f"{base_url.rstrip('/')}/{api_path.lstrip('/')}"
-
-        # Retry transient transport errors (e.g., incomplete chunked reads).
-        # Do not retry server/client status errors to avoid hiding real failures.
-        last_error: Exception | None = None
-        for attempt in range(config.bs_request_max_retries):
-            try:
-                response = await client.get(url, params=params)
-                response.raise_for_status()  # Raise an exception for HTTP errors
-                return response.json()
-            except httpx.RequestError as e:
-                last_error = e
-                if attempt == (config.bs_request_max_retries - 1):
-                    break
-                # Exponential backoff on transient transport issues
-                await anyio.sleep(0.5 * (2**attempt))
-        assert last_error is not None
-        raise last_error
+    client = _get_httpx_client()
+    if params is None:
+        params = {}
+    if config.bs_api_key:
+        params["apikey"] = config.bs_api_key
+    
+    # Add SettleMint authentication as query parameter if accessing SettleMint URL
+    if (config.settlemint_blockscout_url and 
+        config.settlemint_application_access_token and 
+        base_url.rstrip('/') == config.settlemint_blockscout_url.rstrip('/')):
+        params['token'] = config.settlemint_application_access_token
+
+    url = f"{base_url.rstrip('/')}/{api_path.lstrip('/')}"
+
+    # Retry transient transport errors (e.g., incomplete chunked reads).
+    # Do not retry server/client status errors to avoid hiding real failures.
+    last_error: Exception | None = None
+    for attempt in range(config.bs_request_max_retries):
+        try:
+            response = await client.get(url, params=params, timeout=config.bs_timeout)
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            return response.json()
+        except httpx.RequestError as e:
+            last_error = e
+            if attempt == (config.bs_request_max_retries - 1):
+                break
+            # Exponential backoff on transient transport issues
+            await anyio.sleep(0.5 * (2**attempt))
+    assert last_error is not None
+    raise last_error
 
 
 async def make_bens_request(api_path: str, params: dict | None = None) -> dict:
@@ -203,11 +265,10 @@ async def make_bens_request(api_path: str, params: dict | None = None) -> dict:
         httpx.HTTPStatusError: If the HTTP request returns an error status code
         httpx.TimeoutException: If the request times out
     """
-    async with _create_httpx_client(timeout=config.bens_timeout, headers=None) as client:
-        url = f"{config.bens_url}{api_path}"
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    url = f"{config.bens_url}{api_path}"
+    response = await _get_httpx_client().get(url, params=params, timeout=config.bens_timeout)
+    response.raise_for_status()
+    return response.json()
 
 
 async def make_chainscout_request(api_path: str, params: dict | None = None) -> dict:
@@ -225,11 +286,10 @@ async def make_chainscout_request(api_path: str, params: dict | None = None) ->
         httpx.HTTPStatusError: If the HTTP request returns an error status code
         httpx.TimeoutException: If the request times out
     """
-    async with _create_httpx_client(timeout=config.chainscout_timeout, headers=None) as client:
-        url = f"{config.chainscout_url}{api_path}"
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    url = f"{config.chainscout_url}{api_path}"
+    response = await _get_httpx_client().get(url, params=params, timeout=config.chainscout_timeout)
+    response.raise_for_status()
+    return response.json()
 
 
 async def make_metadata_request(api_path: str, params: dict | None = None) -> dict:
@@ -247,11 +307,10 @@ async def make_metadata_request(api_path: str, params: dict | None = None) -> di
         httpx.HTTPStatusError: If the HTTP request returns an error status code
         httpx.TimeoutException: If the request times out
     """
-    async with _create_httpx_client(timeout=config.metadata_timeout, headers=None) as client:
-        url = f"{config.metadata_url}{api_path}"
-        response = await client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
+    url = f"{config.metadata_url}{api_path}"
+    response = await _get_httpx_client().get(url, params=params, timeout=config.metadata_timeout)
+    response.raise_for_status()
+    return response.json()
 
 
 async def make_request_with_periodic_progress(
@@ -380,12 +439,22 @@ def decode_cursor(cursor: str) -> dict:
     """Decodes and JSON-deserializes a cursor string."""
     if not cursor:
         raise InvalidCursorError("Cursor cannot be empty.")
+    # Return a copy so callers cannot mutate the cached result
+    return dict(_decode_cursor_cached(cursor))
+
+
+# Agents often replay the same cursor, e.g. when retrying a page
+@functools.lru_cache(maxsize=1024)
+def _decode_cursor_cached(cursor: str) -> dict:
     try:
         padded_cursor = cursor + "=" * (-len(cursor) % 4)
         json_string = base64.urlsafe_b64decode(padded_cursor.encode("utf-8")).decode("utf-8")
-        return json.loads(json_string)
+        decoded = json.loads(json_string)
     except (TypeError, ValueError, json.JSONDecodeError, base64.binascii.Error) as e:
         raise InvalidCursorError("Invalid or expired cursor provided.") from e
+    if not isinstance(decoded, dict):
+        raise InvalidCursorError("Invalid or expired cursor provided.")
+    return decoded
 
 
 def _recursively_truncate_and_flag_long_strings(data: Any) -> tuple[Any, bool]:
@@ -501,7 +570,7 @@ async def report_and_log_progress(
 
 def build_tool_response(
     data: Any,
-    data_description: list[str] | None = None,
+    data_description: Sequence[str] | None = None,
     notes: list[str] | None = None,
     instructions: list[str] | None = None,
     pagination: PaginationInfo | None = None,
@@ -511,7 +580,7 @@ def build_tool_response(
 
     Args:
         data: The main data payload for the response.
-        data_description: Optional list of strings describing the data structure.
+        data_description: Optional sequence of strings describing the data structure.
         notes: Optional list of strings for warnings or contextual notes.
         instructions: Optional list of strings for follow-up actions.
         pagination: Optional PaginationInfo object if the data is paginated.
@@ -598,21 +667,35 @@ def create_items_pagination(
         return sliced_items, None
 
     next_page_params = cursor_extractor(last_item_for_cursor)
-    next_cursor = encode_cursor(next_page_params)
-
-    final_params = next_call_base_params.copy()
-    final_params["cursor"] = next_cursor
-
-    pagination = PaginationInfo(
-        next_call=NextCallInfo(
-            tool_name=tool_name,
-            params=final_params,
-        )
+    pagination = create_cursor_pagination(
+        tool_name=tool_name,
+        next_call_base_params=next_call_base_params,
+        next_page_params=next_page_params,
     )
 
     return sliced_items, pagination
 
 
+def create_cursor_pagination(
+    *,
+    tool_name: str,
+    next_call_base_params: dict,
+    next_page_params: dict | None,
+) -> PaginationInfo | None:
+    """
+    Build pagination info pointing at the next page, or None if there is no next page.
+
+    The cursor is encoded from ``next_page_params`` and added to a copy of
+    ``next_call_base_params``. The models are built without validation since
+    every field is produced here.
+    """
+    if not next_page_params:
+        return None
+
+    params = {**next_call_base_params, "cursor": encode_cursor(next_page_params)}
+    return PaginationInfo.model_construct(next_call=NextCallInfo.model_construct(tool_name=tool_name, params=params))
+
+
 def extract_log_cursor_params(item: dict) -> dict:
     """Return cursor parameters extracted from a log item."""
 
@@ -23,6 +23,27 @@ from blockscout_mcp_server.tools.common import (
 from blockscout_mcp_server.tools.decorators import log_tool_invocation
 
 
+def _build_instructions_data() -> InstructionsData:
+    """Build the validated instructions payload from the module constants."""
+    chain_id_guidance = ChainIdGuidance(
+        rules=CHAIN_ID_RULES,
+        recommended_chains=[ChainInfo(**chain) for chain in RECOMMENDED_CHAINS],
+    )
+    return InstructionsData(
+        version=SERVER_VERSION,
+        error_handling_rules=ERROR_HANDLING_RULES,
+        chain_id_guidance=chain_id_guidance,
+        pagination_rules=PAGINATION_RULES,
+        time_based_query_rules=TIME_BASED_QUERY_RULES,
+        block_time_estimation_rules=BLOCK_TIME_ESTIMATION_RULES,
+        efficiency_optimization_rules=EFFICIENCY_OPTIMIZATION_RULES,
+    )
+
+
+# The instructions payload is built from constants only, so it is validated once at import
+_INSTRUCTIONS_DATA = _build_instructions_data()
+
+
 # It is very important to keep the tool description in such form to force the LLM to call this tool first
 # before calling any other tool. Altering of the description could provide opportunity to LLM to skip this tool.
 @log_tool_invocation
@@ -47,21 +68,8 @@ async def __unlock_blockchain_analysis__(ctx: Context) -> ToolResponse[Instructi
         message="Fetching server instructions...",
     )
 
-    # Construct the structured data payload
-    chain_id_guidance = ChainIdGuidance(
-        rules=CHAIN_ID_RULES,
-        recommended_chains=[ChainInfo(**chain) for chain in RECOMMENDED_CHAINS],
-    )
-
-    instructions_data = InstructionsData(
-        version=SERVER_VERSION,
-        error_handling_rules=ERROR_HANDLING_RULES,
-        chain_id_guidance=chain_id_guidance,
-        pagination_rules=PAGINATION_RULES,
-        time_based_query_rules=TIME_BASED_QUERY_RULES,
-        block_time_estimation_rules=BLOCK_TIME_ESTIMATION_RULES,
-        efficiency_optimization_rules=EFFICIENCY_OPTIMIZATION_RULES,
-    )
+    # The envelope is built per call because ToolResponse is mutable; only the payload is shared
+    response = build_tool_response(data=_INSTRUCTIONS_DATA)
 
     # Report completion
     await report_and_log_progress(
@@ -71,4 +79,4 @@ async def __unlock_blockchain_analysis__(ctx: Context) -> ToolResponse[Instructi
         message="Server instructions ready.",
     )
 
-    return build_tool_response(data=instructions_data)
+    return response
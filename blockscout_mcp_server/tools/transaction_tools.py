@@ -6,6 +6,8 @@ from pydantic import Field
 from blockscout_mcp_server.config import config
 from blockscout_mcp_server.constants import INPUT_DATA_TRUNCATION_LIMIT
 from blockscout_mcp_server.models import (
+    ADVANCED_FILTER_ITEMS_ADAPTER,
+    TRANSACTION_LOG_ITEMS_ADAPTER,
     AdvancedFilterItem,
     ToolResponse,
     TransactionInfoData,
@@ -317,7 +319,7 @@ async def get_transactions_by_address(
     )
 
     # Convert to AdvancedFilterItem objects
-    validated_items = [AdvancedFilterItem.model_validate(item) for item in final_items]
+    validated_items = ADVANCED_FILTER_ITEMS_ADAPTER.validate_python(final_items)
 
     return build_tool_response(data=validated_items, pagination=pagination)
 
@@ -433,7 +435,7 @@ async def get_token_transfers_by_address(
         cursor_extractor=extract_advanced_filters_cursor_params,
     )
     # All the fields returned by the API except the ones in `fields_to_remove` are added to the response
-    sliced_items = [AdvancedFilterItem.model_validate(item) for item in sliced_items]
+    sliced_items = ADVANCED_FILTER_ITEMS_ADAPTER.validate_python(sliced_items)
 
     return build_tool_response(data=sliced_items, pagination=pagination)
 
@@ -591,9 +593,9 @@ async def get_transaction_logs(
     log_items_dicts: list[dict] = []
     # To preserve the LLM context, only specific fields are added to the response
     for item in original_items:
-        address_value = (
-            item.get("address", {}).get("hash") if isinstance(item.get("address"), dict) else item.get("address")
-        )
+        address_value = item.get("address")
+        if isinstance(address_value, dict):
+            address_value = address_value.get("hash")
         curated_item = {
             "address": address_value,
             "block_number": item.get("block_number"),
@@ -647,7 +649,7 @@ async def get_transaction_logs(
         cursor_extractor=extract_log_cursor_params,
     )
 
-    log_items = [TransactionLogItem(**item) for item in sliced_items]
+    log_items = TRANSACTION_LOG_ITEMS_ADAPTER.validate_python(sliced_items)
 
     await report_and_log_progress(ctx, progress=2.0, total=2.0, message="Successfully fetched transaction logs.")
 
@@ -0,0 +1,81 @@
+"""Tests for the REST API helper utilities."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from blockscout_mcp_server.api.helpers import (
+    ORJSONResponse,
+    compile_param_extractor,
+    loads_json,
+    pydantic_response,
+    str_to_bool,
+)
+from blockscout_mcp_server.models import ToolResponse
+
+
+def _request(**query_params: str) -> SimpleNamespace:
+    return SimpleNamespace(query_params=query_params)
+
+
+def test_compiled_extractor_returns_required_and_optional_params():
+    extract = compile_param_extractor(required=("chain_id",), optional=("cursor",))
+    params = extract(_request(chain_id="1", cursor="abc", unrelated="x"))
+    assert params == {"chain_id": "1", "cursor": "abc"}
+
+
+def test_compiled_extractor_skips_missing_optional_params():
+    extract = compile_param_extractor(required=("chain_id",), optional=("cursor",))
+    assert extract(_request(chain_id="1")) == {"chain_id": "1"}
+
+
+def test_compiled_extractor_raises_for_missing_required_param():
+    extract = compile_param_extractor(required=("chain_id", "address"), optional=())
+    with pytest.raises(ValueError, match="Missing required query parameter: 'address'"):
+        extract(_request(chain_id="1"))
+
+
+def test_compiled_extractor_applies_registered_converters():
+    extract = compile_param_extractor(required=("chain_id",), optional=("include_transactions",))
+    params = extract(_request(chain_id="1", include_transactions="true"))
+    assert params == {"chain_id": "1", "include_transactions": True}
+
+
+@pytest.mark.parametrize("value", ["true", "True", "TRUE", "1", "t", "yes", "YES", "tRuE"])
+def test_str_to_bool_truthy_values(value):
+    assert str_to_bool(value) is True
+
+
+@pytest.mark.parametrize("value", ["false", "False", "0", "no", "", "truthy"])
+def test_str_to_bool_falsy_values(value):
+    assert str_to_bool(value) is False
+
+
+def test_orjson_response_renders_compact_json():
+    response = ORJSONResponse({"data": {"a": 1, "b": [True, None]}})
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {"data": {"a": 1, "b": [True, None]}}
+
+
+def test_orjson_response_keeps_large_integers_exact():
+    value = 2**256 - 1
+    response = ORJSONResponse({"result": value})
+    assert json.loads(response.body) == {"result": value}
+
+
+def test_loads_json_parses_object():
+    assert loads_json('{"name": "balanceOf", "inputs": []}') == {"name": "balanceOf", "inputs": []}
+
+
+def test_loads_json_raises_json_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        loads_json("{not json")
+
+
+def test_pydantic_response_serializes_model_directly():
+    tool_response = ToolResponse(data={"balance": 2**256 - 1}, notes=["note"])
+    response = pydantic_response(tool_response, status_code=410)
+    assert response.status_code == 410
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == tool_response.model_dump()
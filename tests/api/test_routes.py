@@ -46,6 +46,26 @@ async def test_static_routes_work_correctly(client: AsyncClient):
     assert "text/plain" in response_llms.headers["content-type"]
 
 
+@pytest.mark.asyncio
+@patch("blockscout_mcp_server.api.routes.INDEX_HTML_CONTENT", "<h1>Blockscout MCP Server</h1>")
+@patch("blockscout_mcp_server.api.routes.LLMS_TXT_CONTENT", "# Blockscout MCP Server")
+async def test_static_routes_support_etag_revalidation(client: AsyncClient):
+    """Static pages carry an ETag and answer a matching If-None-Match with 304."""
+    for path in ("/", "/llms.txt"):
+        first = await client.get(path)
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=300"
+
+        revalidated = await client.get(path, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+
+        stale = await client.get(path, headers={"If-None-Match": '"outdated"'})
+        assert stale.status_code == 200
+        assert stale.content == first.content
+
+
 @pytest.mark.asyncio
 async def test_routes_not_found_on_clean_app():
     """Verify that static routes are not available on a clean, un-configured app."""
@@ -567,6 +587,7 @@ async def test_get_chains_list_success(mock_tool, client: AsyncClient):
         ),
         (httpx.TimeoutException("timeout"), 504),
         (ValueError("bad input"), 400),
+        (RuntimeError("boom"), 500),
     ],
 )
 @patch("blockscout_mcp_server.api.routes.get_latest_block", new_callable=AsyncMock)
@@ -577,3 +598,31 @@ async def test_error_handling(mock_tool, client: AsyncClient, side_effect, statu
     assert response.status_code == status
     assert response.json() == {"error": str(side_effect)}
     mock_tool.assert_called_once_with(chain_id="1", ctx=ANY)
+
+
+@pytest.mark.asyncio
+async def test_unknown_v1_route_returns_404(client: AsyncClient):
+    """Unknown paths under /v1 are not turned into JSON errors."""
+    response = await client.get("/v1/does_not_exist")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+@patch("blockscout_mcp_server.api.routes.get_latest_block", new_callable=AsyncMock)
+async def test_large_responses_are_gzipped(mock_tool, client: AsyncClient):
+    """Large tool responses are compressed when the client accepts gzip."""
+    mock_tool.return_value = ToolResponse(data={"items": ["0x" + "ab" * 64] * 100})
+    response = await client.get("/v1/get_latest_block?chain_id=1", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["data"] == {"items": ["0x" + "ab" * 64] * 100}
+
+
+@pytest.mark.asyncio
+@patch("blockscout_mcp_server.api.routes.get_latest_block", new_callable=AsyncMock)
+async def test_small_responses_are_not_gzipped(mock_tool, client: AsyncClient):
+    """Responses below the size threshold are sent as-is."""
+    mock_tool.return_value = ToolResponse(data={"block_number": 123})
+    response = await client.get("/v1/get_latest_block?chain_id=1", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
@@ -25,10 +25,14 @@ class DummyCtx:
 def reset_mode_and_client(monkeypatch):
     analytics.set_http_mode(False)
     # Ensure private module state is reset between tests
-    monkeypatch.setattr(analytics, "_mp_client", None, raising=False)  # type: ignore[attr-defined]
+    monkeypatch.setattr(analytics, "_mp_state", analytics._UNSET)
+    monkeypatch.setattr(analytics, "_mp_consumer", None)
+    # Keep the tests hermetic when the mixpanel package is not installed
+    monkeypatch.setattr(analytics, "BufferedConsumer", MagicMock())
     yield
     analytics.set_http_mode(False)
-    monkeypatch.setattr(analytics, "_mp_client", None, raising=False)  # type: ignore[attr-defined]
+    monkeypatch.setattr(analytics, "_mp_state", analytics._UNSET)
+    monkeypatch.setattr(analytics, "_mp_consumer", None)
 
 
 def test_noop_when_not_http_mode(monkeypatch):
@@ -46,6 +50,16 @@ def test_noop_when_no_token(monkeypatch):
         mp_cls.assert_not_called()
 
 
+def test_disabled_state_is_cached(monkeypatch):
+    monkeypatch.setattr(server_config, "mixpanel_token", "", raising=False)
+    analytics.set_http_mode(True)
+    # A token appearing later is not picked up until HTTP mode is re-initialized
+    monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
+    with patch("blockscout_mcp_server.analytics.Mixpanel") as mp_cls:
+        analytics.track_tool_invocation(DummyCtx(), "some_tool", {"a": 1})
+        mp_cls.assert_not_called()
+
+
 def test_tracks_with_headers(monkeypatch):
     monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
     headers = {"x-forwarded-for": "203.0.113.5, 70.41.3.18", "user-agent": "pytest-UA"}
@@ -74,6 +88,71 @@ def test_tracks_with_headers(monkeypatch):
         assert kwargs.get("meta") == {"ip": "203.0.113.5"}
 
 
+@pytest.mark.asyncio
+async def test_tracks_in_background_when_loop_running(monkeypatch):
+    monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
+    headers = {"x-forwarded-for": "203.0.113.5"}
+    ctx = DummyCtx(request=DummyRequest(headers=headers), client_name="clientA", client_version="1.0.0")
+    with patch("blockscout_mcp_server.analytics.Mixpanel") as mp_cls:
+        mp_instance = MagicMock()
+        mp_cls.return_value = mp_instance
+        analytics.set_http_mode(True)
+        analytics.track_tool_invocation(ctx, "tool_name", {"x": 2})
+        # The event is queued, not sent inline
+        mp_instance.track.assert_not_called()
+        await analytics.flush_pending_events()
+        args, kwargs = mp_instance.track.call_args
+        assert args[1] == "tool_name"
+        assert kwargs.get("meta") == {"ip": "203.0.113.5"}
+
+
+@pytest.mark.asyncio
+async def test_flush_pending_events_flushes_buffered_consumer(monkeypatch):
+    monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
+    monkeypatch.setattr(server_config, "mixpanel_api_host", "api-eu.mixpanel.com", raising=False)
+    with (
+        patch("blockscout_mcp_server.analytics.Mixpanel") as mp_cls,
+        patch("blockscout_mcp_server.analytics.BufferedConsumer") as consumer_cls,
+    ):
+        consumer = consumer_cls.return_value
+        analytics.set_http_mode(True)
+        consumer_cls.assert_called_once_with(max_size=50, api_host="api-eu.mixpanel.com")
+        mp_cls.assert_called_once_with("test-token", consumer=consumer)
+
+        analytics.track_tool_invocation(DummyCtx(), "tool_name", {})
+        await analytics.flush_pending_events()
+        mp_cls.return_value.track.assert_called_once()
+        consumer.flush.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_flush_pending_events_stops_worker_before_final_flush(monkeypatch):
+    monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
+    with (
+        patch("blockscout_mcp_server.analytics.Mixpanel"),
+        patch("blockscout_mcp_server.analytics.BufferedConsumer") as consumer_cls,
+    ):
+        consumer = consumer_cls.return_value
+        analytics.set_http_mode(True)
+        analytics.track_tool_invocation(DummyCtx(), "tool_name", {})
+        worker = analytics._worker_task
+
+        def flush_after_worker_stopped():
+            # The final flush must not overlap with the worker's own idle flush
+            assert worker.done()
+
+        consumer.flush.side_effect = flush_after_worker_stopped
+        await analytics.flush_pending_events()
+
+        assert worker.cancelled()
+        consumer.flush.assert_called_once()
+
+        # A later event starts a fresh worker
+        analytics.track_tool_invocation(DummyCtx(), "tool_name", {})
+        assert analytics._worker_task is not worker
+        await analytics.flush_pending_events()
+
+
 def test_tracks_with_intermediary_header(monkeypatch):
     monkeypatch.setattr(server_config, "mixpanel_token", "test-token", raising=False)
     headers = {
@@ -1,3 +1,4 @@
+import uuid
 from types import SimpleNamespace
 
 from blockscout_mcp_server.analytics import _build_distinct_id, _extract_request_ip
@@ -11,6 +12,13 @@ def test_extract_request_ip_headers_prefer_xff():
     assert ip == "203.0.113.10"
 
 
+def test_extract_request_ip_single_xff_value_with_whitespace():
+    headers = {"x-forwarded-for": "  203.0.113.11  "}
+    request = SimpleNamespace(headers=headers, client=SimpleNamespace(host="198.51.100.2"))
+    ctx = SimpleNamespace(request_context=SimpleNamespace(request=request))
+    assert _extract_request_ip(ctx) == "203.0.113.11"
+
+
 def test_extract_request_ip_fallbacks():
     # No xff, but X-Real-IP present
     headers = {"X-Real-IP": "192.0.2.9", "User-Agent": "UA-2"}
@@ -27,6 +35,12 @@ def test_extract_request_ip_fallbacks():
     assert ip2 == "10.0.0.5"
 
 
+def test_extract_request_ip_without_request():
+    assert _extract_request_ip(SimpleNamespace()) == ""
+    assert _extract_request_ip(SimpleNamespace(request_context=None)) == ""
+    assert _extract_request_ip(SimpleNamespace(request_context=SimpleNamespace(request=None))) == ""
+
+
 def test_extract_request_ip_precedence_when_both_headers_present():
     headers = {"X-Forwarded-For": "198.51.100.10, 203.0.113.20", "X-Real-IP": "192.0.2.9"}
     request = SimpleNamespace(headers=headers, client=SimpleNamespace(host="10.0.0.1"))
@@ -57,3 +71,8 @@ def test_build_distinct_id_stable():
     assert d != a
     e = _build_distinct_id("1.2.3.4", "clientZ", "1.0")
     assert e != a
+
+
+def test_build_distinct_id_matches_uuid5():
+    expected = uuid.uuid5(uuid.NAMESPACE_URL, "https://blockscout.com/mcp/1.2.3.4|client|1.0")
+    assert _build_distinct_id("1.2.3.4", "client", "1.0") == str(expected)
@@ -1,11 +1,13 @@
+import asyncio
 from collections.abc import Callable
 from unittest.mock import patch
 
 import anyio
 import pytest
 
-from blockscout_mcp_server.cache import CachedContract, ChainCache, ContractCache
+from blockscout_mcp_server.cache import BlockCache, CachedContract, ChainCache, ChainsListCache, ContractCache
 from blockscout_mcp_server.config import config
+from blockscout_mcp_server.models import ChainInfo
 from blockscout_mcp_server.tools.common import find_blockscout_url
 
 pytestmark = pytest.mark.anyio
@@ -42,14 +44,14 @@ async def test_chain_cache_basic_flow():
     cache = ChainCache()
     with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(1000)):
         await cache.set("1", "https://a")
-    assert cache.get("1") == ("https://a", 1000 + config.chain_cache_ttl_seconds)
+        assert cache.get("1") == ("https://a", 1000 + config.chain_cache_ttl_seconds)
 
 
 async def test_chain_cache_set_failure():
     cache = ChainCache()
     with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(2000)):
         await cache.set_failure("2")
-    assert cache.get("2") == (None, 2000 + config.chain_cache_ttl_seconds)
+        assert cache.get("2") == (None, 2000 + config.chain_cache_ttl_seconds)
 
 
 async def test_chain_cache_bulk_set():
@@ -57,8 +59,8 @@ async def test_chain_cache_bulk_set():
     chain_urls = {"1": "https://a", "2": "https://b"}
     with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(3000)):
         await cache.bulk_set(chain_urls)
-    assert cache.get("1") == ("https://a", 3000 + config.chain_cache_ttl_seconds)
-    assert cache.get("2") == ("https://b", 3000 + config.chain_cache_ttl_seconds)
+        assert cache.get("1") == ("https://a", 3000 + config.chain_cache_ttl_seconds)
+        assert cache.get("2") == ("https://b", 3000 + config.chain_cache_ttl_seconds)
 
 
 async def test_chain_cache_bulk_set_handles_none():
@@ -66,61 +68,179 @@ async def test_chain_cache_bulk_set_handles_none():
     chain_urls = {"1": "https://a", "2": None}
     with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(3500)):
         await cache.bulk_set(chain_urls)
-    assert cache.get("1") == ("https://a", 3500 + config.chain_cache_ttl_seconds)
-    assert cache.get("2") == (None, 3500 + config.chain_cache_ttl_seconds)
+        assert cache.get("1") == ("https://a", 3500 + config.chain_cache_ttl_seconds)
+        assert cache.get("2") == (None, 3500 + config.chain_cache_ttl_seconds)
+
+
+async def test_chain_cache_get_evicts_expired_entry():
+    cache = ChainCache()
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(5000)):
+        await cache.set("1", "https://a")
+    with patch(
+        "blockscout_mcp_server.cache.time.monotonic",
+        fake_monotonic_factory(5000 + config.chain_cache_ttl_seconds),
+    ):
+        assert cache.get("1") is None
+    assert "1" not in cache._cache
 
 
 async def test_chain_cache_invalidate():
     cache = ChainCache()
     with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(4000)):
         await cache.set("1", "https://a")
-    assert cache.get("1") == ("https://a", 4000 + config.chain_cache_ttl_seconds)
+        assert cache.get("1") == ("https://a", 4000 + config.chain_cache_ttl_seconds)
     await cache.invalidate("1")
     await cache.invalidate("1")
     assert cache.get("1") is None
 
 
-async def test_chain_cache_invalidate_missing_chain_does_not_create_lock():
+async def test_chain_cache_invalidate_missing_chain_is_noop():
     cache = ChainCache()
     await cache.invalidate("1")
-    assert "1" not in cache._lock_keys
+    assert cache.get("1") is None
+
+
+async def test_chain_cache_get_or_fetch_coalesces_concurrent_misses():
+    cache = ChainCache()
+    calls = 0
+    release = anyio.Event()
+    results: list[str | None] = []
+
+    async def fetcher() -> str | None:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "https://a"
+
+    async def worker() -> None:
+        results.append(await cache.get_or_fetch("1", fetcher))
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(worker)
+        await anyio.sleep(0)
+        release.set()
+
+    assert calls == 1
+    assert results == ["https://a"] * 5
+    assert cache.get("1")[0] == "https://a"
+    assert cache._inflight == {}
 
 
-async def test_chain_cache_creates_distinct_locks():
+async def test_chain_cache_get_or_fetch_hit_skips_fetcher():
     cache = ChainCache()
     await cache.set("1", "https://a")
-    await cache.set("2", "https://b")
-    assert {"1", "2"} <= cache._lock_keys
-    lock1 = await cache._get_or_create_lock("1")
-    lock2 = await cache._get_or_create_lock("2")
-    assert lock1 is not lock2
 
+    async def fetcher() -> str | None:
+        raise AssertionError("fetcher should not be called on a cache hit")
+
+    assert await cache.get_or_fetch("1", fetcher) == "https://a"
 
-async def test_chain_cache_bulk_set_allows_progress_for_unlocked_chains():
+
+async def test_chain_cache_get_or_fetch_shares_exception():
     cache = ChainCache()
-    lock1 = await cache._get_or_create_lock("1")
-    await lock1.acquire()
+    release = anyio.Event()
+    errors: list[Exception] = []
+
+    async def fetcher() -> str | None:
+        await release.wait()
+        raise ValueError("boom")
 
-    async def run_bulk() -> None:
-        await cache.bulk_set({"1": "https://a", "2": "https://b"})
+    async def worker() -> None:
+        try:
+            await cache.get_or_fetch("1", fetcher)
+        except ValueError as exc:
+            errors.append(exc)
 
     async with anyio.create_task_group() as tg:
-        tg.start_soon(run_bulk)
-        for _ in range(50):
-            if cache.get("2") is not None:
-                break
-            await anyio.sleep(0)
-        assert cache.get("2")[0] == "https://b"
-        lock1.release()
+        for _ in range(3):
+            tg.start_soon(worker)
+        await anyio.sleep(0)
+        release.set()
 
-    assert cache.get("1")[0] == "https://a"
+    assert len(errors) == 3
+    assert cache.get("1") is None
+    assert cache._inflight == {}
+
+
+async def test_chain_cache_get_or_fetch_serves_stale_url_while_refreshing():
+    cache = ChainCache()
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(1000)):
+        await cache.set("1", "https://old")
+
+    release = anyio.Event()
 
+    async def fetcher() -> str | None:
+        await release.wait()
+        return "https://new"
 
-async def test_chain_cache_same_chain_uses_same_lock():
+    stale_time = 1000 + config.chain_cache_ttl_seconds
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(stale_time)):
+        assert await cache.get_or_fetch("1", fetcher) == "https://old"
+        assert await cache.get_or_fetch("1", fetcher) == "https://old"
+        assert len(cache._refresh_tasks) == 1
+        release.set()
+        await asyncio.gather(*cache._refresh_tasks)
+        assert await cache.get_or_fetch("1", fetcher) == "https://new"
+
+    assert cache._refresh_tasks == set()
+    assert cache._inflight == {}
+
+
+async def test_chain_cache_failed_refresh_keeps_stale_url():
+    cache = ChainCache()
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(1000)):
+        await cache.set("1", "https://old")
+
+    async def fetcher() -> str | None:
+        raise ValueError("boom")
+
+    stale_time = 1000 + config.chain_cache_ttl_seconds
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(stale_time)):
+        assert await cache.get_or_fetch("1", fetcher) == "https://old"
+        await asyncio.gather(*cache._refresh_tasks, return_exceptions=True)
+        assert await cache.get_or_fetch("1", fetcher) == "https://old"
+        await asyncio.gather(*cache._refresh_tasks, return_exceptions=True)
+
+
+async def test_chain_cache_get_or_fetch_refetches_expired_failure():
     cache = ChainCache()
-    lock1 = await cache._get_or_create_lock("1")
-    lock2 = await cache._get_or_create_lock("1")
-    assert lock1 is lock2
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(1000)):
+        await cache.set_failure("1")
+
+    async def fetcher() -> str | None:
+        return "https://a"
+
+    with patch(
+        "blockscout_mcp_server.cache.time.monotonic",
+        fake_monotonic_factory(1000 + config.chain_cache_ttl_seconds),
+    ):
+        assert await cache.get_or_fetch("1", fetcher) == "https://a"
+    assert cache._refresh_tasks == set()
+
+
+def test_chains_list_cache_uses_monotonic_clock():
+    cache = ChainsListCache()
+    chains = [
+        ChainInfo(
+            name="Ethereum",
+            chain_id="1",
+            is_testnet=False,
+            native_currency="ETH",
+            ecosystem="Ethereum",
+            settlement_layer_chain_id=None,
+        )
+    ]
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(100)):
+        cache.store_snapshot(chains)
+        assert cache.expiry_timestamp == 100 + config.chains_list_ttl_seconds
+        assert cache.get_if_fresh() == chains
+    with patch(
+        "blockscout_mcp_server.cache.time.monotonic",
+        fake_monotonic_factory(100 + config.chains_list_ttl_seconds),
+    ):
+        assert cache.get_if_fresh() is None
+        assert cache.needs_refresh()
 
 
 @pytest.mark.asyncio
@@ -169,3 +289,111 @@ async def test_contract_cache_access_refreshes_lru():
     assert await cache.get("B") is None
     assert await cache.get("A") is not None
     assert await cache.get("C") is not None
+
+
+@pytest.mark.asyncio
+async def test_contract_cache_set_refreshes_existing_entry_position():
+    cache = ContractCache()
+    cache._max_size = 2
+    await cache.set("A", CachedContract(metadata={}, source_files={}))
+    await cache.set("B", CachedContract(metadata={}, source_files={}))
+    await cache.set("A", CachedContract(metadata={"v": 2}, source_files={}))
+    await cache.set("C", CachedContract(metadata={}, source_files={}))
+    assert await cache.get("B") is None
+    assert (await cache.get("A")).metadata == {"v": 2}
+
+
+async def test_block_cache_entries_expire_after_their_own_ttl():
+    cache = BlockCache()
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(100)):
+        await cache.set(("https://a", "/latest"), ["latest"], 2)
+        await cache.set(("https://a", "/block"), {"height": 1}, 600)
+    with patch("blockscout_mcp_server.cache.time.monotonic", fake_monotonic_factory(102)):
+        assert await cache.get(("https://a", "/latest")) is None
+        assert await cache.get(("https://a", "/block")) == {"height": 1}
+
+
+async def test_block_cache_lru_eviction():
+    cache = BlockCache()
+    cache._max_size = 2
+    await cache.set(("u", "a"), 1, 60)
+    await cache.set(("u", "b"), 2, 60)
+    assert await cache.get(("u", "a")) == 1
+    await cache.set(("u", "c"), 3, 60)
+    assert await cache.get(("u", "b")) is None
+    assert await cache.get(("u", "a")) == 1
+    assert await cache.get(("u", "c")) == 3
+
+
+async def test_block_cache_get_or_fetch_coalesces_concurrent_misses():
+    cache = BlockCache()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetcher():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"height": 1}
+
+    tasks = [asyncio.create_task(cache.get_or_fetch(("u", "p"), fetcher, 60)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert calls == 1
+    assert results == [{"height": 1}] * 5
+    assert await cache.get(("u", "p")) == {"height": 1}
+
+
+async def test_block_cache_get_or_fetch_does_not_cache_failures():
+    cache = BlockCache()
+
+    async def failing_fetcher():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch(("u", "p"), failing_fetcher, 60)
+    assert await cache.get(("u", "p")) is None
+    assert cache._inflight == {}
+
+
+def test_block_cache_is_finalized_uses_latest_known_height():
+    cache = BlockCache()
+    assert not cache.is_finalized("u", 1)
+
+    cache.record_latest_height("u", 1000)
+    cache.record_latest_height("u", 900)
+
+    assert cache.is_finalized("u", 1000 - config.block_cache_min_confirmations)
+    assert not cache.is_finalized("u", 1001 - config.block_cache_min_confirmations)
+
+
+async def test_block_cache_clear_drops_inflight_fetches():
+    cache = BlockCache()
+    releases = [asyncio.Event(), asyncio.Event()]
+    calls = 0
+
+    async def fetcher():
+        nonlocal calls
+        release = releases[calls]
+        calls += 1
+        await release.wait()
+        return {"height": calls}
+
+    first = asyncio.create_task(cache.get_or_fetch(("u", "p"), fetcher, 60))
+    await asyncio.sleep(0)
+    cache.clear()
+    assert cache._inflight == {}
+
+    second = asyncio.create_task(cache.get_or_fetch(("u", "p"), fetcher, 60))
+    await asyncio.sleep(0)
+    assert calls == 2
+
+    releases[0].set()
+    await first
+    # The stale fetch must not drop the entry registered after the clear
+    assert ("u", "p") in cache._inflight
+    releases[1].set()
+    await second
+    assert cache._inflight == {}
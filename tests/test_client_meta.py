@@ -1,12 +1,16 @@
 from types import SimpleNamespace
 
+from starlette.datastructures import Headers
+
 from blockscout_mcp_server.client_meta import (
     UNDEFINED_CLIENT_NAME,
     UNDEFINED_CLIENT_VERSION,
     UNKNOWN_PROTOCOL_VERSION,
+    _compile_allowlist,
     _parse_intermediary_header,
     extract_client_meta_from_ctx,
     get_header_case_insensitive,
+    get_lowercase_headers,
 )
 from blockscout_mcp_server.config import config
 
@@ -53,6 +57,19 @@ def test_extract_client_meta_uses_user_agent_when_name_missing():
     assert meta.protocol == UNKNOWN_PROTOCOL_VERSION
 
 
+def test_extract_client_meta_uses_user_agent_when_name_is_placeholder():
+    # A client reporting the placeholder name itself is treated as unnamed
+    client_params = SimpleNamespace(clientInfo=SimpleNamespace(name=UNDEFINED_CLIENT_NAME, version="1.0"))
+    request = SimpleNamespace(headers={"User-Agent": "ua-test/9.9.9"})
+    ctx = SimpleNamespace(
+        session=SimpleNamespace(client_params=client_params),
+        request_context=SimpleNamespace(request=request),
+    )
+
+    meta = extract_client_meta_from_ctx(ctx)
+    assert meta.name == "ua-test/9.9.9"
+
+
 def test_get_header_case_insensitive_with_dict():
     headers = {"User-Agent": "ua-test/1.0", "X-Real-IP": "1.2.3.4"}
     assert get_header_case_insensitive(headers, "user-agent") == "ua-test/1.0"
@@ -61,6 +78,18 @@ def test_get_header_case_insensitive_with_dict():
     assert get_header_case_insensitive(headers, "missing", "default") == "default"
 
 
+def test_get_lowercase_headers_with_dict():
+    headers = get_lowercase_headers({"User-Agent": "ua-test/1.0", "X-Real-IP": "1.2.3.4"})
+    assert headers.get("user-agent") == "ua-test/1.0"
+    assert headers.get("x-real-ip") == "1.2.3.4"
+    assert headers.get("missing") is None
+
+
+def test_get_lowercase_headers_returns_starlette_headers_as_is():
+    headers = Headers({"User-Agent": "ua-test/1.0"})
+    assert get_lowercase_headers(headers) is headers
+
+
 def _ctx_with_intermediary(value: str) -> SimpleNamespace:
     headers = {"Blockscout-MCP-Intermediary": value}
     request = SimpleNamespace(headers=headers)
@@ -144,3 +173,19 @@ def test_parse_intermediary_header_too_long():
 def test_parse_intermediary_header_multiple_values():
     allowlist = "ClaudeDesktop,HigressPlugin"
     assert _parse_intermediary_header(" ,HigressPlugin,Other", allowlist) == "HigressPlugin"
+
+
+def test_compile_allowlist_normalizes_entries():
+    assert _compile_allowlist(" ClaudeDesktop, ,higressPlugin ") == frozenset({"claudedesktop", "higressplugin"})
+
+
+def test_parse_intermediary_header_control_char():
+    allowlist = "Bad\x7fValue,Bad\x00Value"
+    assert _parse_intermediary_header("Bad\x7fValue", allowlist) == ""
+    assert _parse_intermediary_header("Bad\x00Value", allowlist) == ""
+
+
+def test_get_header_case_insensitive_with_starlette_headers():
+    headers = Headers(headers={"User-Agent": "ua-test/1.0"})
+    assert get_header_case_insensitive(headers, "USER-AGENT") == "ua-test/1.0"
+    assert get_header_case_insensitive(headers, "missing", "default") == "default"
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+import types
 from unittest.mock import patch
 
 from blockscout_mcp_server.logging_utils import replace_rich_handlers_with_standard
@@ -65,9 +66,14 @@ class TestReplaceRichHandlersWithStandard:
         """Set up test environment before each test."""
         # Store original logger manager state
         self.original_logger_dict = logging.Logger.manager.loggerDict.copy()
+        # The mock handlers imitate Rich, so make the process look like Rich is loaded
+        self.rich_modules_patch = patch.dict(sys.modules, {"rich": sys.modules.get("rich", types.ModuleType("rich"))})
+        self.rich_modules_patch.start()
 
     def teardown_method(self):
         """Clean up test environment after each test."""
+        self.rich_modules_patch.stop()
+
         # Clear handlers from all loggers to prevent interference
         for logger_name in list(logging.Logger.manager.loggerDict.keys()):
             logger = logging.getLogger(logger_name)
@@ -225,6 +231,31 @@ class TestReplaceRichHandlersWithStandard:
         # Logger should still have no handlers
         assert len(test_logger.handlers) == 0
 
+    def test_noop_when_rich_not_imported(self):
+        """Test that handlers are left untouched when Rich was never imported."""
+        test_logger = logging.getLogger("test_rich_not_imported_logger")
+        rich_handler = MockRichHandler()
+        test_logger.addHandler(rich_handler)
+
+        with patch.dict(sys.modules):
+            sys.modules.pop("rich", None)
+            replace_rich_handlers_with_standard()
+
+        assert test_logger.handlers == [rich_handler]
+
+    def test_skips_placeholder_logger_entries(self):
+        """Test that PlaceHolder entries in the logger dict are skipped."""
+        child_logger = logging.getLogger("test_placeholder_parent.child")
+        rich_handler = MockRichHandler()
+        child_logger.addHandler(rich_handler)
+        assert isinstance(logging.Logger.manager.loggerDict["test_placeholder_parent"], logging.PlaceHolder)
+
+        replace_rich_handlers_with_standard()
+
+        assert rich_handler not in child_logger.handlers
+        assert len(child_logger.handlers) == 1
+        assert isinstance(child_logger.handlers[0], logging.StreamHandler)
+
     def test_handles_handler_inspection_errors_gracefully(self, caplog):
         """Test graceful handling of errors during handler inspection."""
         caplog.set_level(logging.DEBUG)
@@ -1,3 +1,4 @@
+import os
 import re
 import sys
 from unittest.mock import MagicMock, patch
@@ -33,6 +34,41 @@ def test_http_and_rest_flags_call_register_routes(mock_uvicorn_run):
     del sys.modules["blockscout_mcp_server.api.routes"]
 
 
+@patch("uvicorn.run")
+def test_http_mode_disables_uvicorn_per_request_overhead(mock_uvicorn_run):
+    """Verify that HTTP mode turns off uvicorn's access log and default headers."""
+    from blockscout_mcp_server.server import cli_app
+
+    result = runner.invoke(cli_app, ["--http"])
+
+    assert result.exit_code == 0
+    kwargs = mock_uvicorn_run.call_args.kwargs
+    assert kwargs["access_log"] is False
+    assert kwargs["proxy_headers"] is False
+    assert kwargs["server_header"] is False
+    assert kwargs["date_header"] is False
+
+    runner.invoke(cli_app, ["--http", "--proxy-headers"])
+    assert mock_uvicorn_run.call_args.kwargs["proxy_headers"] is True
+
+
+@patch("uvicorn.run")
+def test_http_workers_run_app_factory(mock_uvicorn_run, monkeypatch):
+    """Verify that --workers hands uvicorn an app factory and forwards the REST flag."""
+    from blockscout_mcp_server.server import _REST_API_ENV_VAR, cli_app
+
+    monkeypatch.delenv(_REST_API_ENV_VAR, raising=False)
+
+    result = runner.invoke(cli_app, ["--http", "--rest", "--workers", "4"])
+
+    assert result.exit_code == 0
+    args, kwargs = mock_uvicorn_run.call_args
+    assert args[0] == "blockscout_mcp_server.server:create_http_app"
+    assert kwargs["factory"] is True
+    assert kwargs["workers"] == 4
+    assert os.environ[_REST_API_ENV_VAR] == "1"
+
+
 @patch("uvicorn.run")
 @patch("blockscout_mcp_server.server.register_api_routes", create=True)
 def test_http_only_does_not_register_rest_routes(mock_register_routes, mock_uvicorn_run):
@@ -54,3 +90,13 @@ def test_stdio_mode_works(mock_mcp_run):
     result = runner.invoke(cli_app, [])
     assert result.exit_code == 0
     mock_mcp_run.assert_called_once()
+
+
+def test_get_mcp_builds_server_once():
+    """Verify that the FastMCP server is built on first use and then reused."""
+    from blockscout_mcp_server.server import _TOOLS, get_mcp
+
+    mcp = get_mcp()
+
+    assert get_mcp() is mcp
+    assert len(mcp._tool_manager.list_tools()) == len(_TOOLS)
@@ -1,4 +1,5 @@
 # tests/tools/test_address_tools.py
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -437,6 +438,33 @@ async def test_get_address_info_success_with_metadata(mock_ctx):
         assert mock_ctx.info.call_count == 4
 
 
+@pytest.mark.asyncio
+async def test_get_address_info_matches_metadata_key_case_insensitively(mock_ctx):
+    """Metadata keyed by a differently-cased address is still attached."""
+    chain_id = "1"
+    address = "0xabcDEF"
+    metadata = {"tags": [{"name": "Test Tag"}]}
+
+    with (
+        patch(
+            "blockscout_mcp_server.tools.address_tools.get_blockscout_base_url", new_callable=AsyncMock
+        ) as mock_get_url,
+        patch(
+            "blockscout_mcp_server.tools.address_tools.make_blockscout_request", new_callable=AsyncMock
+        ) as mock_bs_request,
+        patch(
+            "blockscout_mcp_server.tools.address_tools.make_metadata_request", new_callable=AsyncMock
+        ) as mock_meta_request,
+    ):
+        mock_get_url.return_value = "https://eth.blockscout.com"
+        mock_bs_request.return_value = {"hash": address}
+        mock_meta_request.return_value = {"addresses": {"0xABCdef": metadata}}
+
+        result = await get_address_info(chain_id=chain_id, address=address, ctx=mock_ctx)
+
+        assert result.data.metadata == metadata
+
+
 @pytest.mark.asyncio
 async def test_get_address_info_success_without_metadata(mock_ctx):
     """
@@ -554,3 +582,88 @@ async def test_get_address_info_blockscout_failure(mock_ctx):
 
         assert mock_ctx.report_progress.call_count == 2
         assert mock_ctx.info.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_address_info_blockscout_failure_cancels_metadata_request(mock_ctx):
+    """Ensure the pending metadata request is cancelled when the primary call fails."""
+    chain_id = "1"
+    address = "0x123abc"
+    api_error = httpx.HTTPStatusError("Not Found", request=MagicMock(), response=MagicMock(status_code=404))
+    metadata_started = asyncio.Event()
+    metadata_cancelled = asyncio.Event()
+
+    async def slow_metadata_request(**kwargs):
+        metadata_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            metadata_cancelled.set()
+            raise
+
+    async def failing_blockscout_request(**kwargs):
+        await metadata_started.wait()
+        raise api_error
+
+    with (
+        patch(
+            "blockscout_mcp_server.tools.address_tools.get_blockscout_base_url",
+            new_callable=AsyncMock,
+            return_value="https://eth.blockscout.com",
+        ),
+        patch(
+            "blockscout_mcp_server.tools.address_tools.make_blockscout_request",
+            side_effect=failing_blockscout_request,
+        ),
+        patch(
+            "blockscout_mcp_server.tools.address_tools.make_metadata_request",
+            side_effect=slow_metadata_request,
+        ),
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_address_info(chain_id=chain_id, address=address, ctx=mock_ctx)
+
+        await asyncio.wait_for(metadata_cancelled.wait(), timeout=1)
+
+
+
+@pytest.mark.asyncio
+async def test_get_address_info_waits_for_cancelled_metadata_request(mock_ctx):
+    """Ensure the metadata task has finished by the time the primary failure propagates."""
+    chain_id = "1"
+    address = "0x123abc"
+    metadata_started = asyncio.Event()
+    metadata_finished = asyncio.Event()
+
+    async def slow_metadata_request(**kwargs):
+        metadata_started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            await asyncio.sleep(0)
+            metadata_finished.set()
+            raise
+
+    async def failing_blockscout_request(**kwargs):
+        await metadata_started.wait()
+        raise httpx.HTTPStatusError("Not Found", request=MagicMock(), response=MagicMock(status_code=404))
+
+    with (
+        patch(
+            "blockscout_mcp_server.tools.address_tools.get_blockscout_base_url",
+            new_callable=AsyncMock,
+            return_value="https://eth.blockscout.com",
+        ),
+        patch(
+            "blockscout_mcp_server.tools.address_tools.make_blockscout_request",
+            side_effect=failing_blockscout_request,
+        ),
+        patch(
+            "blockscout_mcp_server.tools.address_tools.make_metadata_request",
+            side_effect=slow_metadata_request,
+        ),
+    ):
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_address_info(chain_id=chain_id, address=address, ctx=mock_ctx)
+
+    assert metadata_finished.is_set()
@@ -350,27 +350,8 @@ async def test_nft_tokens_by_address_with_pagination(mock_ctx):
         mock_get_url.return_value = mock_base_url
         mock_request.return_value = mock_api_response
 
-        # Create processed items format that the function expects
-        processed_items = []
-        for item in items[:10]:
-            token = item.get("token", {})
-            processed_item = {
-                "token": token,
-                "amount": item.get("amount", ""),
-                "token_instances": [],
-                "collection_info": {
-                    "type": token.get("type", ""),
-                    "address": token.get("address_hash", ""),
-                    "name": token.get("name"),
-                    "symbol": token.get("symbol"),
-                    "holders_count": token.get("holders_count") or 0,
-                    "total_supply": token.get("total_supply") or 0,
-                },
-            }
-            processed_items.append(processed_item)
-
-        # Return processed items and pagination info
-        mock_create_pagination.return_value = (processed_items, mock_pagination)
+        # Pagination slices the raw API items
+        mock_create_pagination.return_value = (items[:10], mock_pagination)
 
         result = await nft_tokens_by_address(chain_id=chain_id, address=address, ctx=mock_ctx)
 
@@ -380,6 +361,7 @@ async def test_nft_tokens_by_address_with_pagination(mock_ctx):
         assert call_args[1]["page_size"] == 10  # default nft_page_size
         assert call_args[1]["tool_name"] == "nft_tokens_by_address"
         assert call_args[1]["next_call_base_params"] == {"chain_id": chain_id, "address": address}
+        assert call_args[1]["items"] == items
         assert callable(call_args[1]["cursor_extractor"])
         assert call_args[1]["force_pagination"] is False
 
@@ -471,27 +453,8 @@ async def test_nft_tokens_by_address_response_sliced(mock_ctx):
         mock_get_url.return_value = mock_base_url
         mock_request.return_value = mock_api_response
 
-        # Create processed items format that the function expects
-        processed_items = []
-        for item in items[:10]:
-            token = item.get("token", {})
-            processed_item = {
-                "token": token,
-                "amount": item.get("amount", ""),
-                "token_instances": [],
-                "collection_info": {
-                    "type": token.get("type", ""),
-                    "address": token.get("address_hash", ""),
-                    "name": token.get("name"),
-                    "symbol": token.get("symbol"),
-                    "holders_count": token.get("holders_count") or 0,
-                    "total_supply": token.get("total_supply") or 0,
-                },
-            }
-            processed_items.append(processed_item)
-
-        # Return processed items and pagination info
-        mock_create_pagination.return_value = (processed_items, mock_pagination)
+        # Pagination slices the raw API items
+        mock_create_pagination.return_value = (items[:10], mock_pagination)
 
         result = await nft_tokens_by_address(chain_id=chain_id, address=address, ctx=mock_ctx)
 
@@ -540,27 +503,8 @@ async def test_nft_tokens_by_address_custom_page_size(mock_ctx):
         mock_get_url.return_value = mock_base_url
         mock_request.return_value = mock_api_response
 
-        # Create processed items format that the function expects
-        processed_items = []
-        for item in items[:5]:
-            token = item.get("token", {})
-            processed_item = {
-                "token": token,
-                "amount": item.get("amount", ""),
-                "token_instances": [],
-                "collection_info": {
-                    "type": token.get("type", ""),
-                    "address": token.get("address_hash", ""),
-                    "name": token.get("name"),
-                    "symbol": token.get("symbol"),
-                    "holders_count": token.get("holders_count") or 0,
-                    "total_supply": token.get("total_supply") or 0,
-                },
-            }
-            processed_items.append(processed_item)
-
-        # Return processed items and pagination info
-        mock_create_pagination.return_value = (processed_items, mock_pagination)
+        # Pagination slices the raw API items
+        mock_create_pagination.return_value = (items[:5], mock_pagination)
 
         result = await nft_tokens_by_address(chain_id=chain_id, address=address, ctx=mock_ctx)
 
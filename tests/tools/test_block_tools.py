@@ -4,8 +4,18 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
+from blockscout_mcp_server.cache import block_cache
+from blockscout_mcp_server.config import config
 from blockscout_mcp_server.models import BlockInfoData, LatestBlockData, ToolResponse
-from blockscout_mcp_server.tools.block_tools import get_block_info, get_latest_block
+from blockscout_mcp_server.tools.block_tools import _cache_if_finalized, get_block_info, get_latest_block
+
+
+@pytest.fixture(autouse=True)
+def clear_block_cache():
+    """Keep cached block responses from leaking between tests."""
+    block_cache.clear()
+    yield
+    block_cache.clear()
 
 
 @pytest.mark.asyncio
@@ -272,3 +282,94 @@ async def test_get_block_info_total_failure(mock_ctx):
             await get_block_info(
                 chain_id=chain_id, number_or_hash=number_or_hash, include_transactions=True, ctx=mock_ctx
             )
+
+
+@pytest.mark.asyncio
+async def test_get_latest_block_reuses_recent_response(mock_ctx):
+    """Verify repeated polls within the TTL share one upstream request."""
+    mock_base_url = "https://eth.blockscout.com"
+
+    with (
+        patch(
+            "blockscout_mcp_server.tools.block_tools.get_blockscout_base_url",
+            new_callable=AsyncMock,
+            return_value=mock_base_url,
+        ),
+        patch(
+            "blockscout_mcp_server.tools.block_tools.make_blockscout_request",
+            new_callable=AsyncMock,
+            return_value=[{"height": 12345, "timestamp": "2023-01-01T00:00:00Z"}],
+        ) as mock_request,
+    ):
+        first = await get_latest_block(chain_id="1", ctx=mock_ctx)
+        second = await get_latest_block(chain_id="1", ctx=mock_ctx)
+
+    mock_request.assert_called_once_with(base_url=mock_base_url, api_path="/api/v2/main-page/blocks")
+    assert first.data == second.data
+
+
+@pytest.mark.asyncio
+async def test_get_block_info_caches_finalized_blocks_only(mock_ctx):
+    """Verify blocks are cached once they are deep enough below the latest block."""
+    mock_base_url = "https://eth.blockscout.com"
+    block_cache.record_latest_height(mock_base_url, 1000)
+
+    async def mock_request_side_effect(base_url, api_path, params=None):
+        return {"height": int(api_path.rsplit("/", 1)[-1])}
+
+    with (
+        patch(
+            "blockscout_mcp_server.tools.block_tools.get_blockscout_base_url",
+            new_callable=AsyncMock,
+            return_value=mock_base_url,
+        ),
+        patch(
+            "blockscout_mcp_server.tools.block_tools.make_blockscout_request",
+            new_callable=AsyncMock,
+            side_effect=mock_request_side_effect,
+        ) as mock_request,
+    ):
+        for _ in range(2):
+            await get_block_info(chain_id="1", number_or_hash="100", ctx=mock_ctx)
+            result = await get_block_info(chain_id="1", number_or_hash="999", ctx=mock_ctx)
+
+    assert result.data.block_details == {"height": 999}
+    requested_paths = [call.kwargs["api_path"] for call in mock_request.call_args_list]
+    assert requested_paths == ["/api/v2/blocks/100", "/api/v2/blocks/999", "/api/v2/blocks/999"]
+
+
+@pytest.mark.asyncio
+async def test_get_block_info_cache_hits_do_not_extend_ttl(mock_ctx):
+    """Verify a cached finalized block expires its TTL after the first fetch, however often it is read."""
+    mock_base_url = "https://eth.blockscout.com"
+    block_cache.record_latest_height(mock_base_url, 1000)
+    ttl = config.block_cache_ttl_seconds
+
+    with (
+        patch(
+            "blockscout_mcp_server.tools.block_tools.get_blockscout_base_url",
+            new_callable=AsyncMock,
+            return_value=mock_base_url,
+        ),
+        patch(
+            "blockscout_mcp_server.tools.block_tools.make_blockscout_request",
+            new_callable=AsyncMock,
+            return_value={"height": 100},
+        ) as mock_request,
+    ):
+        for now in (0, ttl * 0.9, ttl * 1.1):
+            with patch("blockscout_mcp_server.cache.time.monotonic", return_value=now):
+                await get_block_info(chain_id="1", number_or_hash="100", ctx=mock_ctx)
+
+    assert mock_request.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_if_finalized_skips_non_dict_block_data():
+    """Verify an unexpected block payload is not cached."""
+    mock_base_url = "https://eth.blockscout.com"
+    block_cache.record_latest_height(mock_base_url, 1000)
+
+    await _cache_if_finalized(mock_base_url, ["unexpected"], {"/api/v2/blocks/100": ["unexpected"]})
+
+    assert await block_cache.get((mock_base_url, "/api/v2/blocks/100")) is None
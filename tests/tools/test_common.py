@@ -1,3 +1,6 @@
+import asyncio
+import logging
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -10,10 +13,13 @@ from blockscout_mcp_server.constants import (
 from blockscout_mcp_server.models import NextCallInfo, PaginationInfo, ToolResponse
 from blockscout_mcp_server.tools.common import (
     InvalidCursorError,
+    _get_httpx_client,
     _process_and_truncate_log_items,
     _recursively_truncate_and_flag_long_strings,
     apply_cursor_to_params,
     build_tool_response,
+    close_httpx_client,
+    create_cursor_pagination,
     create_items_pagination,
     decode_cursor,
     encode_cursor,
@@ -45,6 +51,24 @@ def test_decode_empty_cursor():
         decode_cursor("")
 
 
+def test_decode_non_object_cursor():
+    """Verify a cursor that does not encode a JSON object is rejected."""
+    with pytest.raises(InvalidCursorError, match="Invalid or expired cursor provided."):
+        decode_cursor(encode_cursor([1, 2]))
+
+
+def test_decode_replayed_cursor_returns_independent_copies():
+    """Verify replayed cursors are served from the cache without sharing the result."""
+    cursor = encode_cursor({"block_number": 1, "index": 2})
+
+    first = decode_cursor(cursor)
+    first["index"] = 99
+    second = decode_cursor(cursor)
+
+    assert second == {"block_number": 1, "index": 2}
+    assert first is not second
+
+
 def test_decode_valid_base64_invalid_json():
     """Verify decoding valid base64 that isn't JSON raises an error."""
     invalid_json_cursor = "bm90IGpzb24="  # base64 for 'not json'
@@ -66,6 +90,69 @@ async def test_report_and_log_progress(mock_ctx: Context):
     mock_ctx.info.assert_called_once_with(expected_log_message)
 
 
+@pytest.mark.asyncio
+async def test_get_httpx_client_is_shared_until_closed():
+    """Verify request helpers share one pooled client that is rebuilt after closing."""
+    client = _get_httpx_client()
+    try:
+        assert _get_httpx_client() is client
+    finally:
+        await close_httpx_client()
+
+    assert client.is_closed
+    replacement = _get_httpx_client()
+    try:
+        assert replacement is not client
+    finally:
+        await close_httpx_client()
+
+
+@pytest.mark.asyncio
+async def test_get_httpx_client_closes_client_of_another_running_loop():
+    """Verify a client left on another, still running loop is closed there when replaced."""
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def create_client():
+        return _get_httpx_client()
+
+    try:
+        old_client = asyncio.run_coroutine_threadsafe(create_client(), other_loop).result(timeout=5)
+        client = _get_httpx_client()
+        try:
+            assert client is not old_client
+            for _ in range(100):
+                if old_client.is_closed:
+                    break
+                await asyncio.sleep(0.01)
+            assert old_client.is_closed
+        finally:
+            await close_httpx_client()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join(timeout=5)
+        other_loop.close()
+
+
+@pytest.mark.asyncio
+async def test_get_httpx_client_drops_client_of_stopped_loop(caplog):
+    """Verify a client left on a loop that no longer runs is dropped with a debug log."""
+
+    async def create_client():
+        return _get_httpx_client()
+
+    old_client = await asyncio.to_thread(asyncio.run, create_client())
+
+    with caplog.at_level(logging.DEBUG, logger="blockscout_mcp_server.tools.common"):
+        client = _get_httpx_client()
+    try:
+        assert client is not old_client
+        assert "no longer running" in caplog.text
+    finally:
+        await close_httpx_client()
+
+
 def test_process_and_truncate_log_items_no_truncation():
     """Verify items with data under the limit are untouched."""
     items = [{"data": "0x" + "a" * 10}]
@@ -498,6 +585,37 @@ def test_create_items_pagination_preserves_base_params():
     assert decoded_cursor == {"index": 4}
 
 
+def test_create_cursor_pagination_without_next_page():
+    """Verify no pagination is created when there are no next page params."""
+    for next_page_params in (None, {}):
+        pagination = create_cursor_pagination(
+            tool_name="test_tool",
+            next_call_base_params={"chain_id": "1"},
+            next_page_params=next_page_params,
+        )
+        assert pagination is None
+
+
+def test_create_cursor_pagination_with_next_page():
+    """Verify the cursor is encoded and the base params are left untouched."""
+    base_params = {"chain_id": "1", "address": "0x123"}
+    next_page_params = {"block_number": 100, "index": 5}
+
+    pagination = create_cursor_pagination(
+        tool_name="test_tool",
+        next_call_base_params=base_params,
+        next_page_params=next_page_params,
+    )
+
+    assert pagination == PaginationInfo(
+        next_call=NextCallInfo(
+            tool_name="test_tool",
+            params={"chain_id": "1", "address": "0x123", "cursor": encode_cursor(next_page_params)},
+        )
+    )
+    assert base_params == {"chain_id": "1", "address": "0x123"}
+
+
 def test_extract_log_cursor_params():
     """Verify the log cursor extractor works correctly."""
     from blockscout_mcp_server.tools.common import extract_log_cursor_params
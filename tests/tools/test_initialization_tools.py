@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from blockscout_mcp_server.models import InstructionsData, ToolResponse
+from blockscout_mcp_server.tools import initialization_tools
 from blockscout_mcp_server.tools.initialization_tools import __unlock_blockchain_analysis__
 
 
@@ -38,8 +39,10 @@ async def test_unlock_blockchain_analysis_success(mock_ctx):
         patch("blockscout_mcp_server.tools.initialization_tools.EFFICIENCY_OPTIMIZATION_RULES", mock_efficiency_rules),
         patch("blockscout_mcp_server.tools.initialization_tools.RECOMMENDED_CHAINS", mock_chains),
     ):
-        # ACT
-        result = await __unlock_blockchain_analysis__(ctx=mock_ctx)
+        # The payload is built at import, so it is rebuilt from the patched constants
+        with patch.object(initialization_tools, "_INSTRUCTIONS_DATA", initialization_tools._build_instructions_data()):
+            # ACT
+            result = await __unlock_blockchain_analysis__(ctx=mock_ctx)
 
         # ASSERT
         assert isinstance(result, ToolResponse)
@@ -71,3 +74,13 @@ async def test_unlock_blockchain_analysis_success(mock_ctx):
         end_call = mock_ctx.report_progress.call_args_list[1]
         assert end_call.kwargs["progress"] == 1.0
         assert "Server instructions ready" in end_call.kwargs["message"]
+
+
+@pytest.mark.asyncio
+async def test_unlock_blockchain_analysis_reuses_instructions_payload(mock_ctx):
+    """The constant instructions payload is built once and shared between calls."""
+    first = await __unlock_blockchain_analysis__(ctx=mock_ctx)
+    second = await __unlock_blockchain_analysis__(ctx=mock_ctx)
+    assert first.data is initialization_tools._INSTRUCTIONS_DATA
+    assert second.data is first.data
+    assert second is not first